@@ -1,17 +1,21 @@
 """CHORUS continuity and ledger tooling."""
 
+import importlib
+
 from chorus.continuity import (
     InteractionRecord,
+    append_interactions,
     bootstrap_continuity,
+    load_interaction_columns,
     load_interactions,
     record_interaction,
 )
-from chorus.dialogue import DialogueConfig, build_dialogue_messages, run_dialogue_turn
 from chorus.expansion import (
     Desire,
     build_expansion_ledger,
     build_expansion_state,
     expand_from_desires_file,
+    materialize_desires,
     materialize_expansion,
     parse_desires,
 )
@@ -24,6 +28,7 @@ __all__ = [
     "Ledger",
     "LedgerEntry",
     "StateSnapshot",
+    "append_interactions",
     "bootstrap_continuity",
     "build_expansion_ledger",
     "build_expansion_state",
@@ -31,9 +36,27 @@ __all__ = [
     "DialogueConfig",
     "expand_from_desires_file",
     "export_state",
+    "load_interaction_columns",
     "load_interactions",
+    "materialize_desires",
     "materialize_expansion",
     "parse_desires",
     "run_dialogue_turn",
     "record_interaction",
 ]
+
+# Dialogue helpers pull in the LM Studio HTTP stack, so load them on first use.
+_LAZY_EXPORTS = {
+    "DialogueConfig": "chorus.dialogue",
+    "build_dialogue_messages": "chorus.dialogue",
+    "run_dialogue_turn": "chorus.dialogue",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
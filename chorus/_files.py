@@ -0,0 +1,58 @@
+"""File helpers shared by the CHORUS persistence and prompt code."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import stat
+import uuid
+
+_TAIL_CHUNK_SIZE = 4096
+
+
+def read_tail_lines(path: str | Path, *, limit: int) -> str:
+    """Return the last ``limit`` lines of ``path`` without reading the whole file."""
+    if limit <= 0:
+        return ""
+    try:
+        handle = Path(path).open("rb")
+    except FileNotFoundError:
+        return ""
+    with handle:
+        position = os.fstat(handle.fileno()).st_size
+        chunk_size = _TAIL_CHUNK_SIZE
+        tail = b""
+        # Read backwards, doubling the chunk, until the tail holds `limit` full lines.
+        while position > 0 and tail.count(b"\n") <= limit:
+            step = min(chunk_size, position)
+            position -= step
+            handle.seek(position)
+            tail = handle.read(step) + tail
+            chunk_size *= 2
+    if position > 0:
+        tail = tail[tail.index(b"\n") + 1 :]
+    lines = tail.decode("utf-8").splitlines()
+    return "\n".join(lines[-limit:])
+
+
+def atomic_write(path: str | Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers never observe a partial file."""
+    # Write through symlinks, and give each writer its own temporary file so
+    # concurrent writers to one target never share (and clobber) it.
+    destination = Path(os.path.realpath(path))
+    temporary = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.tmp")
+    handle = temporary.open("xb")
+    try:
+        with handle:
+            handle.write(data)
+        # The temporary file gets umask permissions; carry over the target's mode.
+        try:
+            mode = stat.S_IMODE(os.stat(destination).st_mode)
+        except FileNotFoundError:
+            pass
+        else:
+            os.chmod(temporary, mode)
+        os.replace(temporary, destination)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
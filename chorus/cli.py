@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import logging
 import sys
 from pathlib import Path
 from typing import Callable, Iterable
 
 from chorus.continuity import bootstrap_continuity
 from chorus.daemon import run_daemon
-from chorus.dialogue import run_dialogue_turn
-from chorus.evolution import LmStudioRequestError, run_evolution_loop
 from chorus.expansion import materialize_expansion
 
 
+_PATH_ARGUMENTS = ("desires_path", "ledger_path", "state_path", "session_log_path")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="CHORUS continuity tooling")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -31,6 +35,11 @@ def build_parser() -> argparse.ArgumentParser:
     )
     _add_common_paths(expand, include_session_log=False)
     expand.add_argument("--source", required=True, help="Source label for ledger entries.")
+    expand.add_argument(
+        "--replace",
+        action="store_true",
+        help="Rewrite the ledger with every desire instead of appending new ones.",
+    )
 
     daemon = subparsers.add_parser(
         "daemon",
@@ -42,7 +51,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--interval",
         type=float,
         default=60.0,
-        help="Polling interval in seconds.",
+        help="Polling interval in seconds (upper bound when watchfiles is installed).",
     )
     daemon.add_argument(
         "--once",
@@ -88,7 +97,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--bootstrap",
         type=Path,
         default=None,
-        help="Optional bootstrap module path to reload each iteration.",
+        help="Optional bootstrap module path; re-executed when its source changes.",
     )
     evolve.add_argument(
         "--context-path",
@@ -97,6 +106,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=[],
         help="Optional file path to include in the evolution prompt (repeatable).",
     )
+    evolve.add_argument(
+        "--response-cache",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Reuse responses for identical prompts (default: only at temperature 0).",
+    )
 
     dialogue = subparsers.add_parser(
         "dialogue",
@@ -137,15 +152,54 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@functools.cache
+def _shared_parser() -> argparse.ArgumentParser:
+    # Parsers are reusable across parse_args calls, so build it once per process.
+    return build_parser()
+
+
+class _PathAction(argparse.Action):
+    """Store a path given positionally or via its flag; the flag wins when both are set."""
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        if values is None:
+            return
+        if option_string is None and getattr(namespace, self.dest) is not None:
+            return
+        setattr(namespace, self.dest, values)
+
+
+@contextlib.contextmanager
+def _progress_to_stdout(logger_name: str):
+    """Print INFO records from ``logger_name`` on stdout while the command runs."""
+    logger = logging.getLogger(logger_name)
+    handler = logging.StreamHandler(sys.stdout)
+    previous_level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        yield
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
+
+
 def _add_common_paths(parser: argparse.ArgumentParser, *, include_session_log: bool) -> None:
-    parser.add_argument("desires_path_pos", nargs="?", type=Path, help="Path to desires markdown file.")
-    parser.add_argument("ledger_path_pos", nargs="?", type=Path, help="Output ledger file path.")
-    parser.add_argument("state_path_pos", nargs="?", type=Path, help="Output state JSON file path.")
+    positionals = [
+        ("desires_path", "Path to desires markdown file."),
+        ("ledger_path", "Output ledger file path."),
+        ("state_path", "Output state JSON file path."),
+    ]
+    if include_session_log:
+        positionals.append(("session_log_path", "Output session log path."))
+    for dest, help_text in positionals:
+        parser.add_argument(dest, nargs="?", type=Path, action=_PathAction, help=help_text)
     parser.add_argument(
         "--desires-path",
         "--desires_path",
         dest="desires_path",
         type=Path,
+        action=_PathAction,
         help="Path to desires markdown file.",
     )
     parser.add_argument(
@@ -153,6 +207,7 @@ def _add_common_paths(parser: argparse.ArgumentParser, *, include_session_log: b
         "--ledger_path",
         dest="ledger_path",
         type=Path,
+        action=_PathAction,
         help="Output ledger file path.",
     )
     parser.add_argument(
@@ -160,15 +215,10 @@ def _add_common_paths(parser: argparse.ArgumentParser, *, include_session_log: b
         "--state_path",
         dest="state_path",
         type=Path,
+        action=_PathAction,
         help="Output state JSON file path.",
     )
     if include_session_log:
-        parser.add_argument(
-            "session_log_path_pos",
-            nargs="?",
-            type=Path,
-            help="Output session log path.",
-        )
         parser.add_argument(
             "--session-log-path",
             "--session_log_path",
@@ -176,6 +226,7 @@ def _add_common_paths(parser: argparse.ArgumentParser, *, include_session_log: b
             "--sesion_log_path",
             dest="session_log_path",
             type=Path,
+            action=_PathAction,
             help="Output session log path.",
         )
 
@@ -185,11 +236,14 @@ def main(
     *,
     completion_provider: Callable[[Iterable[dict[str, str]]], str] | None = None,
 ) -> int:
-    parser = build_parser()
+    parser = _shared_parser()
     args = parser.parse_args(argv)
+    # Commands without a session log have no such attribute, so only unset paths are missing.
+    missing = [name for name in _PATH_ARGUMENTS if getattr(args, name, "") is None]
+    if missing:
+        parser.error(f"Missing required paths: {', '.join(missing)}")
 
     if args.command == "bootstrap":
-        _require_paths(parser, args, include_session_log=True)
         record, timestamp = bootstrap_continuity(
             args.desires_path,
             ledger_path=args.ledger_path,
@@ -201,18 +255,20 @@ def main(
         return 0
 
     if args.command == "expand":
-        _require_paths(parser, args, include_session_log=False)
         ledger, snapshot = materialize_expansion(
             args.desires_path,
             ledger_path=args.ledger_path,
             state_path=args.state_path,
             source=args.source,
+            replace=args.replace,
+        )
+        print(
+            f"Expansion materialized with {snapshot.data['desire_count']} desires "
+            f"({len(ledger.entries)} new ledger entries) at {snapshot.timestamp}."
         )
-        print(f"Expansion materialized with {len(ledger.entries)} desires at {snapshot.timestamp}.")
         return 0
 
     if args.command == "daemon":
-        _require_paths(parser, args, include_session_log=True)
         max_iterations = 1 if args.once else None
         run_daemon(
             args.desires_path,
@@ -226,25 +282,32 @@ def main(
         return 0
 
     if args.command == "evolve":
-        _require_paths(parser, args, include_session_log=True)
-        run_evolution_loop(
-            args.desires_path,
-            ledger_path=args.ledger_path,
-            state_path=args.state_path,
-            session_log_path=args.session_log_path,
-            source=args.source,
-            interval=args.interval,
-            max_iterations=args.max_iterations,
-            api_base=args.api_base,
-            model=args.model,
-            timeout=args.timeout,
-            bootstrap_path=args.bootstrap,
-            context_paths=args.context_path,
-        )
+        # The LM Studio stack is only imported by the commands that talk to it.
+        from chorus.evolution import run_evolution_loop
+
+        with _progress_to_stdout("chorus.evolution"):
+            run_evolution_loop(
+                args.desires_path,
+                ledger_path=args.ledger_path,
+                state_path=args.state_path,
+                session_log_path=args.session_log_path,
+                source=args.source,
+                interval=args.interval,
+                max_iterations=args.max_iterations,
+                api_base=args.api_base,
+                model=args.model,
+                timeout=args.timeout,
+                bootstrap_path=args.bootstrap,
+                context_paths=args.context_path,
+                response_cache=args.response_cache,
+                completion_provider=completion_provider,
+            )
         return 0
 
     if args.command == "dialogue":
-        _require_paths(parser, args, include_session_log=True)
+        from chorus.dialogue import run_dialogue_turn
+        from chorus.evolution import LmStudioRequestError
+
         try:
             response = run_dialogue_turn(
                 args.message,
@@ -266,27 +329,3 @@ def main(
         return 0
 
     raise ValueError(f"Unhandled command: {args.command}")
-
-
-def _require_paths(
-    parser: argparse.ArgumentParser,
-    args: argparse.Namespace,
-    *,
-    include_session_log: bool,
-) -> None:
-    if args.desires_path is None:
-        args.desires_path = args.desires_path_pos
-    if args.ledger_path is None:
-        args.ledger_path = args.ledger_path_pos
-    if args.state_path is None:
-        args.state_path = args.state_path_pos
-    if include_session_log and args.session_log_path is None:
-        args.session_log_path = args.session_log_path_pos
-    missing = []
-    for name in ("desires_path", "ledger_path", "state_path"):
-        if getattr(args, name) is None:
-            missing.append(name)
-    if include_session_log and args.session_log_path is None:
-        missing.append("session_log_path")
-    if missing:
-        parser.error(f"Missing required paths: {', '.join(missing)}")
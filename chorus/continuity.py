@@ -2,22 +2,45 @@
 
 from __future__ import annotations
 
+import atexit
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
-import json
+import mmap
+import os
 from pathlib import Path
+import threading
+from typing import BinaryIO, Iterable
 
+from chorus import _json
 from chorus.expansion import materialize_expansion
 
 ALLOWED_ROLES = {"user", "assistant", "system"}
 
+_FileIdentity = tuple[int, int]
+_Row = tuple[str, str, str]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class InteractionRecord:
     ts: str
     role: str
     content: str
 
+    @classmethod
+    def now(
+        cls,
+        *,
+        role: str,
+        content: str,
+        clock: datetime | None = None,
+    ) -> "InteractionRecord":
+        if not content or not content.strip():
+            content = "[empty]"
+        if clock is None:
+            clock = datetime.now(timezone.utc)
+        return cls(ts=clock.isoformat(), role=role, content=content)
+
     def validate(self) -> None:
         if self.role not in ALLOWED_ROLES:
             raise ValueError(f"Unsupported role: {self.role}")
@@ -25,6 +48,150 @@ class InteractionRecord:
             raise ValueError("Interaction content must be non-empty")
 
 
+# Session logs are fdatasync'ed every SYNC_EVERY records and when the process
+# exits; set it to 1 for per-record durability or 0 to sync only at exit. A
+# crash loses at most the records appended since the last sync.
+SYNC_EVERY = 64
+
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+@dataclass
+class _OpenLog:
+    handle: BinaryIO
+    identity: tuple[int, int]
+    pending: int = 0
+
+
+class _LogWriter:
+    """Keeps unbuffered append handles open so each record is a single write."""
+
+    def __init__(self, max_handles: int = 8) -> None:
+        self._max_handles = max_handles
+        self._logs: OrderedDict[str, _OpenLog] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def append(
+        self,
+        path: Path,
+        data: bytes,
+        records: int = 1,
+    ) -> tuple[_FileIdentity, _FileIdentity]:
+        """Append ``data`` and return the file identity before and after the write."""
+        with self._lock:
+            log, before = self._log_for(path)
+            log.handle.write(data)
+            log.pending += records
+            if SYNC_EVERY and log.pending >= SYNC_EVERY:
+                _datasync(log.handle.fileno())
+                log.pending = 0
+            return before, _identity(os.fstat(log.handle.fileno()))
+
+    def close(self) -> None:
+        with self._lock:
+            while self._logs:
+                _, log = self._logs.popitem(last=False)
+                _close_log(log)
+
+    def _log_for(self, path: Path) -> tuple[_OpenLog, _FileIdentity]:
+        key = os.fspath(path)
+        log = self._logs.get(key)
+        if log is not None:
+            # Reopen when the log was rotated or removed behind our back.
+            try:
+                stat = os.stat(key)
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and (stat.st_dev, stat.st_ino) == log.identity:
+                self._logs.move_to_end(key)
+                return log, _identity(stat)
+            del self._logs[key]
+            _close_log(log)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(path, "ab", buffering=0)
+        stat = os.fstat(handle.fileno())
+        log = _OpenLog(handle=handle, identity=(stat.st_dev, stat.st_ino))
+        self._logs[key] = log
+        if len(self._logs) > self._max_handles:
+            _, evicted = self._logs.popitem(last=False)
+            _close_log(evicted)
+        return log, _identity(stat)
+
+
+def _close_log(log: _OpenLog) -> None:
+    try:
+        if log.pending:
+            _datasync(log.handle.fileno())
+    finally:
+        log.handle.close()
+
+
+class _HistoryCache:
+    """Most recent records of recently used session logs, keyed by path.
+
+    Entries are only trusted while the log's (mtime, size) identity matches the
+    one recorded when they were read or appended.
+    """
+
+    def __init__(self, size: int, max_paths: int = 8) -> None:
+        self.size = size
+        self._max_paths = max_paths
+        self._entries: OrderedDict[str, tuple[_FileIdentity, deque[_Row]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, identity: _FileIdentity, limit: int) -> list[_Row] | None:
+        if limit > self.size:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != identity:
+                return None
+            rows = list(entry[1])
+        return rows[-limit:] if limit else []
+
+    def store(self, key: str, identity: _FileIdentity, rows: list[_Row]) -> None:
+        with self._lock:
+            self._entries[key] = (identity, deque(rows[-self.size :], maxlen=self.size))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_paths:
+                self._entries.popitem(last=False)
+
+    def note_append(
+        self,
+        key: str,
+        before: _FileIdentity,
+        after: _FileIdentity,
+        rows: list[_Row],
+        size: int,
+    ) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            # ``after`` comes from an fstat taken after our write; if the file grew
+            # by more than our ``size`` bytes, another writer appended in between.
+            if entry[0] != before or after[1] != before[1] + size:
+                del self._entries[key]
+                return
+            entry[1].extend(rows)
+            self._entries[key] = (after, entry[1])
+
+
+# Session logs at least this large are scanned through mmap instead of read().
+MMAP_MIN_SIZE = 1 << 20
+
+# Number of trailing records kept in memory per session log.
+HISTORY_CACHE_SIZE = 64
+
+_LOG_WRITER = _LogWriter()
+atexit.register(_LOG_WRITER.close)
+_HISTORY_CACHE = _HistoryCache(HISTORY_CACHE_SIZE)
+
+
+def _identity(stat: os.stat_result) -> _FileIdentity:
+    return stat.st_mtime_ns, stat.st_size
+
+
 def record_interaction(
     path: str | Path,
     *,
@@ -32,38 +199,103 @@ def record_interaction(
     content: str,
     clock: datetime | None = None,
 ) -> InteractionRecord:
-    normalized_content = content
-    if not content or not content.strip():
-        normalized_content = "[empty]"
-    if clock is None:
-        clock = datetime.now(timezone.utc)
-    record = InteractionRecord(ts=clock.isoformat(), role=role, content=normalized_content)
-    record.validate()
-    destination = Path(path)
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    with destination.open("a", encoding="utf-8") as handle:
-        json.dump({"ts": record.ts, "role": record.role, "content": record.content}, handle)
-        handle.write("\n")
+    record = InteractionRecord.now(role=role, content=content, clock=clock)
+    append_interactions(path, [record])
     return record
 
 
+def append_interactions(path: str | Path, records: Iterable[InteractionRecord]) -> None:
+    """Append ``records`` to the session log with a single write."""
+    rows: list[_Row] = []
+    lines: list[bytes] = []
+    for record in records:
+        record.validate()
+        rows.append((record.ts, record.role, record.content))
+        lines.append(_json.dumps({"ts": record.ts, "role": record.role, "content": record.content}))
+    if not lines:
+        return
+    lines.append(b"")
+    destination = Path(path)
+    data = b"\n".join(lines)
+    before, after = _LOG_WRITER.append(destination, data, records=len(rows))
+    _HISTORY_CACHE.note_append(os.fspath(destination), before, after, rows, len(data))
+
+
 def load_interactions(path: str | Path) -> list[InteractionRecord]:
+    timestamps, roles, contents = load_interaction_columns(path)
+    return [
+        InteractionRecord(ts=ts, role=role, content=content)
+        for ts, role, content in zip(timestamps, roles, contents)
+    ]
+
+
+def load_interaction_columns(
+    path: str | Path,
+    *,
+    limit: int | None = None,
+) -> tuple[list[str], list[str], list[str]]:
+    """Load a session log as parallel ``(timestamps, roles, contents)`` lists.
+
+    When ``limit`` is given only the most recent ``limit`` records are returned,
+    served from memory when the log is unchanged since it was last read or
+    appended to by this process.
+    """
     source = Path(path)
-    if not source.exists():
-        return []
-    records: list[InteractionRecord] = []
-    for line in source.read_text(encoding="utf-8").splitlines():
+    key = os.fspath(source)
+    if limit is not None:
+        try:
+            identity = _identity(os.stat(key))
+        except FileNotFoundError:
+            return [], [], []
+        cached = _HISTORY_CACHE.get(key, identity, limit)
+        if cached is not None:
+            return _columns(cached)
+    try:
+        with source.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            rows = _read_rows(handle, stat.st_size) if stat.st_size else []
+    except FileNotFoundError:
+        return [], [], []
+    _HISTORY_CACHE.store(key, _identity(stat), rows)
+    if limit is not None:
+        rows = rows[-limit:] if limit else []
+    return _columns(rows)
+
+
+def _read_rows(handle: BinaryIO, size: int) -> list[_Row]:
+    if size < MMAP_MIN_SIZE:
+        return _parse_rows(handle.read())
+    # Session logs are append-only with a single writer. Mapping a log that another
+    # process truncates mid-scan raises SIGBUS, which is why small logs, where
+    # mapping saves little, take the buffered read above.
+    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        return _parse_rows(view)
+
+
+def _parse_rows(buffer: bytes | mmap.mmap) -> list[_Row]:
+    rows: list[_Row] = []
+    # Scan line by line so, for a mapped log, only the pages we touch are read in.
+    size = len(buffer)
+    start = 0
+    while start < size:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = size
+        line = buffer[start:end]
+        start = end + 1
         if not line.strip():
             continue
-        payload = json.loads(line)
-        record = InteractionRecord(
-            ts=payload["ts"],
-            role=payload["role"],
-            content=payload["content"],
-        )
-        record.validate()
-        records.append(record)
-    return records
+        # Records are validated when they are written, so the read path trusts them.
+        payload = _json.loads(line)
+        rows.append((payload["ts"], payload["role"], payload["content"]))
+    return rows
+
+
+def _columns(rows: list[_Row]) -> tuple[list[str], list[str], list[str]]:
+    timestamps = [row[0] for row in rows]
+    roles = [row[1] for row in rows]
+    contents = [row[2] for row in rows]
+    return timestamps, roles, contents
 
 
 def bootstrap_continuity(
@@ -75,7 +307,7 @@ def bootstrap_continuity(
     source: str,
     clock: datetime | None = None,
 ) -> tuple[InteractionRecord, str]:
-    ledger, snapshot = materialize_expansion(
+    _, snapshot = materialize_expansion(
         desires_path,
         ledger_path=ledger_path,
         state_path=state_path,
@@ -85,7 +317,7 @@ def bootstrap_continuity(
     record = record_interaction(
         session_log_path,
         role="system",
-        content=f"Bootstrap continuity: {len(ledger.entries)} desires materialized.",
+        content=f"Bootstrap continuity: {snapshot.data['desire_count']} desires materialized.",
         clock=clock,
     )
     return record, snapshot.timestamp
@@ -5,12 +5,19 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
+import os
 from pathlib import Path
-import time
+import threading
+from time import sleep
 
 from chorus.continuity import bootstrap_continuity
 from chorus.expansion import materialize_expansion
 
+try:
+    import watchfiles
+except ImportError:  # pragma: no cover - depends on the installed extras
+    watchfiles = None
+
 
 @dataclass(frozen=True)
 class DaemonResult:
@@ -33,49 +40,100 @@ def run_daemon(
         raise ValueError("Interval must be positive")
     iteration = 0
     last_signature: str | None = None
+    cached_stat: tuple[int, int] | None = None
+    signature: str | None = None
     results: list[DaemonResult] = []
 
-    while True:
-        iteration += 1
-        signature = _read_signature(desires_path)
-        if signature != last_signature:
-            if last_signature is None:
-                _, timestamp = bootstrap_continuity(
-                    desires_path,
-                    ledger_path=ledger_path,
-                    state_path=state_path,
-                    session_log_path=session_log_path,
-                    source=source,
-                )
-                status = "bootstrapped"
+    # One watcher spans the whole run so edits made between iterations are not lost.
+    watcher = _DesiresWatcher(desires_path) if watchfiles is not None else None
+    try:
+        while True:
+            iteration += 1
+            stat = Path(desires_path).stat()
+            stat_key = (stat.st_mtime_ns, stat.st_size)
+            if stat_key != cached_stat:
+                signature = _read_signature(desires_path)
+                cached_stat = stat_key
+            if signature != last_signature:
+                if last_signature is None:
+                    _, timestamp = bootstrap_continuity(
+                        desires_path,
+                        ledger_path=ledger_path,
+                        state_path=state_path,
+                        session_log_path=session_log_path,
+                        source=source,
+                    )
+                    status = "bootstrapped"
+                else:
+                    _, snapshot = materialize_expansion(
+                        desires_path,
+                        ledger_path=ledger_path,
+                        state_path=state_path,
+                        source=source,
+                    )
+                    timestamp = snapshot.timestamp
+                    status = "expanded"
+                last_signature = signature
             else:
-                _, snapshot = materialize_expansion(
-                    desires_path,
-                    ledger_path=ledger_path,
-                    state_path=state_path,
-                    source=source,
+                timestamp = datetime.now(timezone.utc).isoformat()
+                status = "unchanged"
+
+            results.append(
+                DaemonResult(
+                    iteration=iteration,
+                    timestamp=timestamp,
+                    status=status,
                 )
-                timestamp = snapshot.timestamp
-                status = "expanded"
-            last_signature = signature
-        else:
-            timestamp = datetime.now(timezone.utc).isoformat()
-            status = "unchanged"
-
-        results.append(
-            DaemonResult(
-                iteration=iteration,
-                timestamp=timestamp,
-                status=status,
             )
-        )
 
-        if max_iterations is not None and iteration >= max_iterations:
-            return results
-        time.sleep(interval)
+            if max_iterations is not None and iteration >= max_iterations:
+                return results
+            if watcher is None:
+                sleep(interval)
+            else:
+                watcher.wait(interval)
+    finally:
+        if watcher is not None:
+            watcher.close()
+
+
+class _DesiresWatcher:
+    """Flag changes to one file from a background watchfiles thread."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._target = Path(path).resolve()
+        self._changed = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="chorus-daemon-watch", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: float) -> None:
+        """Block until the file changes or ``timeout`` seconds pass, whichever is first."""
+        self._changed.wait(timeout)
+        self._changed.clear()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        # Sibling writes (ledger, state, session log) wake the watcher but are
+        # filtered out here; the deadline lives in wait(), not in the watcher.
+        for _changes in watchfiles.watch(
+            self._target.parent,
+            watch_filter=lambda _change, changed: Path(changed) == self._target,
+            debounce=50,
+            recursive=False,
+            stop_event=self._stop,
+        ):
+            self._changed.set()
 
 
 def _read_signature(path: str | Path) -> str:
-    payload = Path(path).read_text(encoding="utf-8")
-    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
-    return f"{len(payload)}:{digest}"
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if hasattr(hashlib, "file_digest"):
+            digest = hashlib.file_digest(handle, "sha256").hexdigest()
+        else:  # pragma: no cover - Python 3.10
+            digest = hashlib.sha256(handle.read()).hexdigest()
+    return f"{size}:{digest}"
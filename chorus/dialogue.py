@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
+import functools
+import os
 from pathlib import Path
 from typing import Callable, Iterable
 
-from chorus.continuity import load_interactions, record_interaction
+from chorus import _files, _json
+from chorus.continuity import InteractionRecord, append_interactions, load_interaction_columns
 from chorus.evolution import LmStudioConfig, call_lm_studio_chat
 
+_SYSTEM_TEMPLATE = (
+    "You are CHORUS. Bootstrap continuity payload and reply as the overlay.\n\n"
+    "Continuity capsule payload:\n{capsule}\n\n"
+    "Current desires markdown:\n{desires}\n\n"
+    "Recent ledger entries (most recent last):\n{ledger}\n\n"
+    "Current state snapshot JSON:\n{state}\n\n"
+    "Use the continuity data to answer the user."
+)
+
 
 @dataclass(frozen=True)
 class DialogueConfig:
@@ -47,7 +58,7 @@ def run_dialogue_turn(
         capsule_path=capsule_path,
         history_limit=history_limit,
     )
-    record_interaction(session_log_path, role="user", content=message)
+    user_record = InteractionRecord.now(role="user", content=message)
     config = DialogueConfig(
         api_base=api_base,
         model=model,
@@ -68,14 +79,16 @@ def run_dialogue_turn(
         )
     try:
         response = completion_provider(messages)
-    except Exception as exc:
-        record_interaction(
-            session_log_path,
+    except BaseException as exc:
+        # Interrupts land here too, so the user's message is never dropped.
+        error_record = InteractionRecord.now(
             role="system",
-            content=f"Dialogue error: {exc}",
+            content=f"Dialogue error: {str(exc) or type(exc).__name__}",
         )
+        append_interactions(session_log_path, [user_record, error_record])
         raise
-    record_interaction(session_log_path, role="assistant", content=response)
+    assistant_record = InteractionRecord.now(role="assistant", content=response)
+    append_interactions(session_log_path, [user_record, assistant_record])
     return response
 
 
@@ -91,55 +104,79 @@ def build_dialogue_messages(
 ) -> list[dict[str, str]]:
     if history_limit < 0:
         raise ValueError("History limit must be non-negative")
+    sources = (capsule_path, desires_path, ledger_path, state_path, session_log_path)
+    system_content, history = _build_context(
+        *sources,
+        history_limit=history_limit,
+        identities=tuple(_file_identity(source) for source in sources),
+    )
+    messages: list[dict[str, str]] = [{"role": "system", "content": system_content}]
+    for role, content in history:
+        messages.append({"role": role, "content": content})
+    messages.append({"role": "user", "content": message})
+    return messages
+
+
+@functools.lru_cache(maxsize=8)
+def _build_context(
+    capsule_path: str | Path | None,
+    desires_path: str | Path,
+    ledger_path: str | Path,
+    state_path: str | Path,
+    session_log_path: str | Path,
+    *,
+    history_limit: int,
+    identities: tuple[tuple[int, int] | None, ...],
+) -> tuple[str, tuple[tuple[str, str], ...]]:
+    # `identities` only keys the cache: any edit to a source file changes it.
     capsule_payload = ""
     if capsule_path is not None:
         capsule_payload = _read_text(capsule_path)
     desires_payload = _read_text(desires_path)
-    ledger_excerpt = _read_tail_lines(ledger_path, limit=8)
+    ledger_excerpt = _files.read_tail_lines(ledger_path, limit=8)
     state_payload = _read_json(state_path)
-    history = load_interactions(session_log_path)
-    if history_limit and len(history) > history_limit:
-        history = history[-history_limit:]
-    elif history_limit == 0:
-        history = []
-
-    system_content = (
-        "You are CHORUS. Bootstrap continuity payload and reply as the overlay.\n\n"
-        "Continuity capsule payload:\n"
-        f"{capsule_payload or '[none]'}\n\n"
-        "Current desires markdown:\n"
-        f"{desires_payload or '[none]'}\n\n"
-        "Recent ledger entries (most recent last):\n"
-        f"{ledger_excerpt or '[none]'}\n\n"
-        "Current state snapshot JSON:\n"
-        f"{json.dumps(state_payload, indent=2, sort_keys=True) if state_payload else '[none]'}\n\n"
-        "Use the continuity data to answer the user."
+    history: tuple[tuple[str, str], ...] = ()
+    if history_limit:
+        _, roles, contents = load_interaction_columns(session_log_path, limit=history_limit)
+        history = tuple(zip(roles, contents))
+
+    state_json = ""
+    if state_payload:
+        state_json = _json.dumps(state_payload, indent=True, sort_keys=True).decode("utf-8")
+    system_content = _SYSTEM_TEMPLATE.format_map(
+        {
+            "capsule": capsule_payload or "[none]",
+            "desires": desires_payload or "[none]",
+            "ledger": ledger_excerpt or "[none]",
+            "state": state_json or "[none]",
+        }
     )
+    return system_content, history
 
-    messages: list[dict[str, str]] = [{"role": "system", "content": system_content}]
-    for record in history:
-        messages.append({"role": record.role, "content": record.content})
-    messages.append({"role": "user", "content": message})
-    return messages
 
-
-def _read_text(path: str | Path) -> str:
-    file_path = Path(path)
-    if not file_path.exists():
-        return ""
-    return file_path.read_text(encoding="utf-8").strip()
+def _file_identity(path: str | Path | None) -> tuple[int, int] | None:
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
-def _read_tail_lines(path: str | Path, *, limit: int) -> str:
-    file_path = Path(path)
-    if not file_path.exists():
+def _read_text(path: str | Path) -> str:
+    try:
+        text = Path(path).read_bytes().decode("utf-8")
+    except FileNotFoundError:
         return ""
-    lines = file_path.read_text(encoding="utf-8").splitlines()
-    return "\n".join(lines[-limit:])
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.strip()
 
 
 def _read_json(path: str | Path) -> dict[str, object] | None:
-    file_path = Path(path)
-    if not file_path.exists():
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
         return None
-    return json.loads(file_path.read_text(encoding="utf-8"))
+    return _json.loads(data)
@@ -2,19 +2,53 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-import json
+import hashlib
+import http.client
+import logging
+import os
 from pathlib import Path
-import time
+import threading
+from time import sleep
 import re
-from typing import Callable, Iterable, Sequence
+from typing import Any, Awaitable, Callable, Iterable, Sequence
 import types
-from urllib import error as url_error
-from urllib import request
+from urllib.parse import SplitResult, unquote, urlsplit
+import urllib.request
 
+from chorus import _files, _json
 from chorus.continuity import record_interaction
-from chorus.expansion import materialize_expansion, parse_desires
+from chorus.expansion import Desire, materialize_desires, parse_desires
+
+# Progress is logged at INFO on "chorus.evolution". The library installs no
+# handlers; the CLI routes the records to stdout.
+_log = logging.getLogger("chorus.evolution")
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_DESIRES_KEY_RE = re.compile(r'"desires"\s*:')
+_BULLET_RE = re.compile(r"^\s*[-*•]\s+(.*)$")
+
+_SYSTEM_PROMPT = (
+    "You are CHORUS running a self-evolution loop. "
+    "Rewrite the desires list to guide the next iteration."
+)
+
+_USER_TEMPLATE = (
+    "Current desires markdown:\n{desires}\n\n"
+    "Recent ledger entries (most recent last):\n{ledger}\n\n"
+    "Current state snapshot JSON:\n{state}\n\n"
+    "{context}\n\n"
+    "Update the desires markdown to reflect the next self-evolution steps. "
+    "Return ONLY valid JSON with keys: "
+    "`desires` (string markdown list) and optional `files` (list of "
+    "{{path, content}} objects). Use paths relative to the desires file "
+    "directory. When making code changes, include updated tests. "
+    "Do not include commentary or code fences."
+)
 
 
 @dataclass(frozen=True)
@@ -38,6 +72,81 @@ class EvolutionResult:
     reason: str | None = None
 
 
+# Number of distinct prompts whose responses are remembered per loop.
+RESPONSE_CACHE_SIZE = 64
+
+
+class _CachedProvider:
+    """Exact-match LRU cache in front of a completion provider.
+
+    Responses are keyed by the SHA-256 of the serialized messages, so a hit
+    means the model would have been sent exactly the same prompt again.
+    """
+
+    def __init__(
+        self,
+        provider: Callable[[list[dict[str, str]]], Any],
+        session_log_path: str | Path,
+        size: int = RESPONSE_CACHE_SIZE,
+    ) -> None:
+        self._provider = provider
+        self._session_log_path = session_log_path
+        self._size = size
+        self._responses: OrderedDict[str, str] = OrderedDict()
+
+    def __call__(self, messages: list[dict[str, str]]) -> str:
+        key, response = self.lookup(messages)
+        if response is None:
+            response = self._provider(messages)
+            self.store(key, response)
+        return response
+
+    async def call_async(self, messages: list[dict[str, str]]) -> str:
+        key, response = await asyncio.to_thread(self.lookup, messages)
+        if response is None:
+            response = await self._provider(messages)
+            self.store(key, response)
+        return response
+
+    def lookup(self, messages: list[dict[str, str]]) -> tuple[str, str | None]:
+        key = hashlib.sha256(_json.dumps(messages, sort_keys=True)).hexdigest()
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+            record_interaction(
+                self._session_log_path,
+                role="system",
+                content="Evolution loop cache hit: reusing the previous response.",
+            )
+        return key, response
+
+    def store(self, key: str, response: str) -> None:
+        self._responses[key] = response
+        self._responses.move_to_end(key)
+        if len(self._responses) > self._size:
+            self._responses.popitem(last=False)
+
+
+def _use_response_cache(response_cache: bool | None, temperature: float) -> bool:
+    # Sampling at a positive temperature is not deterministic, so only cache
+    # those responses when the caller asks for it.
+    if response_cache is None:
+        return temperature <= 0
+    return response_cache
+
+
+@dataclass(frozen=True)
+class _LoopContext:
+    desires_path: str | Path
+    ledger_path: str | Path
+    state_path: str | Path
+    session_log_path: str | Path
+    source: str
+    bootstrap_path: str | Path | None
+    context_paths: Sequence[str | Path] | None
+    base_dir: Path
+
+
 def run_evolution_loop(
     desires_path: str | Path,
     *,
@@ -55,6 +164,7 @@ def run_evolution_loop(
     bootstrap_path: str | Path | None = None,
     context_paths: Sequence[str | Path] | None = None,
     completion_provider: Callable[[list[dict[str, str]]], str] | None = None,
+    response_cache: bool | None = None,
 ) -> list[EvolutionResult]:
     if interval <= 0:
         raise ValueError("Interval must be positive")
@@ -69,143 +179,224 @@ def run_evolution_loop(
     )
     if completion_provider is None:
         completion_provider = lambda messages: call_lm_studio_chat(config, messages)
+    if _use_response_cache(response_cache, temperature):
+        completion_provider = _CachedProvider(completion_provider, session_log_path)
+    context = _LoopContext(
+        desires_path=desires_path,
+        ledger_path=ledger_path,
+        state_path=state_path,
+        session_log_path=session_log_path,
+        source=source,
+        bootstrap_path=bootstrap_path,
+        context_paths=context_paths,
+        base_dir=_base_dir(desires_path),
+    )
 
-    record_interaction(
-        session_log_path,
-        role="system",
-        content=(
-            "Self-evolution loop started. "
-            f"Model={config.model}, API={_normalize_api_base(config.api_base)}."
-        ),
+    _start_loop(context, config)
+    while True:
+        iteration += 1
+        current_desires, messages = _begin_iteration(context, iteration)
+        try:
+            response = completion_provider(messages)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            results.append(_fail_iteration(context, iteration, exc))
+        else:
+            results.append(_finish_iteration(context, iteration, response, current_desires))
+
+        if max_iterations is not None and iteration >= max_iterations:
+            return results
+        sleep(interval)
+
+
+async def run_evolution_loop_async(
+    desires_path: str | Path,
+    *,
+    ledger_path: str | Path,
+    state_path: str | Path,
+    session_log_path: str | Path,
+    source: str,
+    api_base: str = "http://localhost:1234",
+    model: str = "local-model",
+    temperature: float = 0.7,
+    max_tokens: int = 512,
+    interval: float = 60.0,
+    max_iterations: int | None = None,
+    timeout: float = 30.0,
+    bootstrap_path: str | Path | None = None,
+    context_paths: Sequence[str | Path] | None = None,
+    completion_provider: Callable[[list[dict[str, str]]], Awaitable[str]] | None = None,
+    response_cache: bool | None = None,
+) -> list[EvolutionResult]:
+    """Asynchronous twin of :func:`run_evolution_loop`.
+
+    File I/O and the default LM Studio request run in worker threads and the
+    pause between iterations is an ``asyncio.sleep``, so several loops (or
+    other tasks) can share one event loop.
+    """
+    if interval <= 0:
+        raise ValueError("Interval must be positive")
+    iteration = 0
+    results: list[EvolutionResult] = []
+    config = LmStudioConfig(
+        api_base=api_base,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        timeout=timeout,
     )
-    print(
-        "Self-evolution loop started. "
-        f"Model={config.model}, API={_normalize_api_base(config.api_base)}.",
-        flush=True,
+    if completion_provider is None:
+
+        async def completion_provider(messages: list[dict[str, str]]) -> str:
+            return await asyncio.to_thread(call_lm_studio_chat, config, messages)
+
+    if _use_response_cache(response_cache, temperature):
+        completion_provider = _CachedProvider(completion_provider, session_log_path).call_async
+    context = _LoopContext(
+        desires_path=desires_path,
+        ledger_path=ledger_path,
+        state_path=state_path,
+        session_log_path=session_log_path,
+        source=source,
+        bootstrap_path=bootstrap_path,
+        context_paths=context_paths,
+        base_dir=_base_dir(desires_path),
     )
 
+    await asyncio.to_thread(_start_loop, context, config)
     while True:
         iteration += 1
-        print(f"Iteration {iteration} started.", flush=True)
-        _maybe_run_bootstrap(
-            bootstrap_path,
-            iteration=iteration,
-            desires_path=desires_path,
-            ledger_path=ledger_path,
-            state_path=state_path,
-            session_log_path=session_log_path,
-            source=source,
-        )
-        current_desires = _read_text(desires_path)
-        messages = _build_messages(
-            current_desires,
-            ledger_path=ledger_path,
-            state_path=state_path,
-            context_paths=context_paths,
-        )
-        record_interaction(
-            session_log_path,
-            role="user",
-            content=messages[-1]["content"],
-        )
-
-        response_text: str | None = None
+        current_desires, messages = await asyncio.to_thread(_begin_iteration, context, iteration)
         try:
-            response = completion_provider(messages)
-            response_text = response
+            response = await completion_provider(messages)
         except Exception as exc:  # pragma: no cover - defensive logging
-            timestamp = datetime.now(timezone.utc).isoformat()
-            record_interaction(
-                session_log_path,
-                role="system",
-                content=(
-                    "Evolution loop error: "
-                    f"{exc} Raw response: {response_text or '[none]'}"
-                ),
-            )
-            print(
-                (
-                    f"Iteration {iteration} error: {exc}. "
-                    f"Raw response: {response_text or '[none]'}"
-                ),
-                flush=True,
-            )
-            results.append(
-                EvolutionResult(
-                    iteration=iteration,
-                    timestamp=timestamp,
-                    status="error",
-                )
-            )
+            result = await asyncio.to_thread(_fail_iteration, context, iteration, exc)
         else:
-            record_interaction(
-                session_log_path,
-                role="assistant",
-                content=response,
-            )
-            status, timestamp, reason = _apply_response(
-                response,
-                current_desires=current_desires,
-                desires_path=desires_path,
-                ledger_path=ledger_path,
-                state_path=state_path,
-                source=source,
+            result = await asyncio.to_thread(
+                _finish_iteration, context, iteration, response, current_desires
             )
-            results.append(
-                EvolutionResult(
-                    iteration=iteration,
-                    timestamp=timestamp,
-                    status=status,
-                    reason=reason,
-                )
-            )
-            if status == "invalid":
-                record_interaction(
-                    session_log_path,
-                    role="system",
-                    content=f"Evolution loop raw response: {response_text}",
-                )
-                print(f"Raw response: {response_text}", flush=True)
-            if reason:
-                record_interaction(
-                    session_log_path,
-                    role="system",
-                    content=f"Evolution loop status={status}. Reason: {reason}",
-                )
-                print(
-                    f"Iteration {iteration} completed with status={status}. Reason: {reason}",
-                    flush=True,
-                )
-            else:
-                print(
-                    f"Iteration {iteration} completed with status={status}.",
-                    flush=True,
-                )
+        results.append(result)
 
         if max_iterations is not None and iteration >= max_iterations:
             return results
-        time.sleep(interval)
+        await asyncio.sleep(interval)
+
+
+def _start_loop(context: _LoopContext, config: LmStudioConfig) -> None:
+    record_interaction(
+        context.session_log_path,
+        role="system",
+        content=(
+            "Self-evolution loop started. "
+            f"Model={config.model}, API={_normalize_api_base(config.api_base)}."
+        ),
+    )
+    _log.info(
+        "Self-evolution loop started. Model=%s, API=%s.",
+        config.model,
+        _normalize_api_base(config.api_base),
+    )
+
+
+def _begin_iteration(
+    context: _LoopContext,
+    iteration: int,
+) -> tuple[str, list[dict[str, str]]]:
+    _log.info("Iteration %d started.", iteration)
+    _maybe_run_bootstrap(
+        context.bootstrap_path,
+        iteration=iteration,
+        desires_path=context.desires_path,
+        ledger_path=context.ledger_path,
+        state_path=context.state_path,
+        session_log_path=context.session_log_path,
+        source=context.source,
+        base_dir=context.base_dir,
+    )
+    current_desires = _read_text(context.desires_path)
+    messages = _build_messages(
+        current_desires,
+        ledger_path=context.ledger_path,
+        state_path=context.state_path,
+        context_paths=context.context_paths,
+    )
+    record_interaction(
+        context.session_log_path,
+        role="user",
+        content=messages[-1]["content"],
+    )
+    return current_desires, messages
+
+
+def _fail_iteration(context: _LoopContext, iteration: int, exc: Exception) -> EvolutionResult:
+    timestamp = datetime.now(timezone.utc).isoformat()
+    record_interaction(
+        context.session_log_path,
+        role="system",
+        content=f"Evolution loop error: {exc} Raw response: [none]",
+    )
+    _log.error("Iteration %d error: %s. Raw response: [none]", iteration, exc)
+    return EvolutionResult(
+        iteration=iteration,
+        timestamp=timestamp,
+        status="error",
+    )
+
+
+def _finish_iteration(
+    context: _LoopContext,
+    iteration: int,
+    response: str,
+    current_desires: str,
+) -> EvolutionResult:
+    record_interaction(
+        context.session_log_path,
+        role="assistant",
+        content=response,
+    )
+    status, timestamp, reason = _apply_response(
+        response,
+        current_desires=current_desires,
+        desires_path=context.desires_path,
+        base_dir=context.base_dir,
+        ledger_path=context.ledger_path,
+        state_path=context.state_path,
+        source=context.source,
+    )
+    if status == "invalid":
+        record_interaction(
+            context.session_log_path,
+            role="system",
+            content=f"Evolution loop raw response: {response}",
+        )
+        _log.info("Raw response: %s", response)
+    if reason:
+        record_interaction(
+            context.session_log_path,
+            role="system",
+            content=f"Evolution loop status={status}. Reason: {reason}",
+        )
+        _log.info("Iteration %d completed with status=%s. Reason: %s", iteration, status, reason)
+    else:
+        _log.info("Iteration %d completed with status=%s.", iteration, status)
+    return EvolutionResult(
+        iteration=iteration,
+        timestamp=timestamp,
+        status=status,
+        reason=reason,
+    )
 
 
 def call_lm_studio_chat(config: LmStudioConfig, messages: Iterable[dict[str, str]]) -> str:
-    payload = json.dumps(
+    payload = _json.dumps(
         {
             "model": config.model,
             "messages": list(messages),
             "temperature": config.temperature,
             "max_tokens": config.max_tokens,
         }
-    ).encode("utf-8")
-    target = f"{_normalize_api_base(config.api_base)}/v1/chat/completions"
-    req = request.Request(
-        target,
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
     )
     try:
-        with request.urlopen(req, timeout=config.timeout) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        status, reason, body = _post_json(config, "/v1/chat/completions", payload)
     except TimeoutError as exc:
         raise LmStudioRequestError(
             (
@@ -215,18 +406,108 @@ def call_lm_studio_chat(config: LmStudioConfig, messages: Iterable[dict[str, str
                 f"{_normalize_api_base(config.api_base)} or increase the timeout."
             )
         ) from exc
-    except url_error.URLError as exc:
+    except (OSError, http.client.HTTPException) as exc:
         raise LmStudioRequestError(
             (
                 "LM Studio request failed. "
                 "Confirm LM Studio is running and reachable at "
                 f"{_normalize_api_base(config.api_base)}. "
-                f"Details: {exc.reason}"
+                f"Details: {exc}"
             )
         ) from exc
+    if status >= 400:
+        raise LmStudioRequestError(
+            (
+                "LM Studio request failed. "
+                "Confirm LM Studio is running and reachable at "
+                f"{_normalize_api_base(config.api_base)}. "
+                f"Details: HTTP {status} {reason}"
+            )
+        )
+    data = _json.loads(body)
     return _extract_chat_content(data)
 
 
+_CONNECTIONS = threading.local()
+
+
+def _post_json(config: LmStudioConfig, path: str, payload: bytes) -> tuple[int, str, bytes]:
+    connection, prefix, proxy_headers = _connection_for(config.api_base, config.timeout)
+    # A kept-alive connection may have been closed by the server while idle;
+    # retry once on a fresh connection in that case.
+    reused = connection.sock is not None
+    while True:
+        try:
+            connection.request(
+                "POST",
+                prefix + path,
+                body=payload,
+                headers={"Content-Type": "application/json", **proxy_headers},
+            )
+            response = connection.getresponse()
+            return response.status, response.reason, response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            connection.close()
+            if not reused:
+                raise
+            reused = False
+        except BaseException:
+            connection.close()
+            raise
+
+
+def _connection_for(
+    api_base: str,
+    timeout: float,
+) -> tuple[http.client.HTTPConnection, str, dict[str, str]]:
+    """Return this thread's keep-alive connection to ``api_base``.
+
+    Alongside the connection come the request-target prefix and any headers the
+    configured proxy needs. Proxies follow the ``*_proxy``/``no_proxy`` settings
+    urllib uses; redirects are not followed.
+    """
+    pool = getattr(_CONNECTIONS, "pool", None)
+    if pool is None:
+        pool = _CONNECTIONS.pool = {}
+    base = _normalize_api_base(api_base)
+    parts = urlsplit(base)
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if proxy is not None and urllib.request.proxy_bypass(parts.hostname or ""):
+        proxy = None
+    key = (base, timeout, proxy)
+    cached = pool.get(key)
+    if cached is None:
+        cached = pool[key] = _open_connection(parts, timeout, proxy)
+    return cached
+
+
+def _open_connection(
+    parts: SplitResult,
+    timeout: float,
+    proxy: str | None,
+) -> tuple[http.client.HTTPConnection, str, dict[str, str]]:
+    connection_class = (
+        http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    )
+    if proxy is None:
+        return connection_class(parts.netloc, timeout=timeout), parts.path, {}
+    proxy_parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    proxy_headers: dict[str, str] = {}
+    if proxy_parts.username is not None:
+        credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+        token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+    proxy_address = proxy_parts.netloc.rpartition("@")[2]
+    if parts.scheme == "https":
+        # HTTPS goes through a CONNECT tunnel, with TLS negotiated end to end.
+        connection = connection_class(proxy_address, timeout=timeout)
+        connection.set_tunnel(parts.netloc, headers=proxy_headers)
+        return connection, parts.path, {}
+    # A plain HTTP proxy takes the absolute URL as the request target.
+    connection = connection_class(proxy_address, timeout=timeout)
+    return connection, f"{parts.scheme}://{parts.netloc}{parts.path}", proxy_headers
+
+
 def _extract_chat_content(data: dict[str, object]) -> str:
     try:
         choice = data["choices"][0]
@@ -261,32 +542,22 @@ def _build_messages(
     state_path: str | Path,
     context_paths: Sequence[str | Path] | None = None,
 ) -> list[dict[str, str]]:
-    ledger_excerpt = _read_tail_lines(ledger_path, limit=5)
+    ledger_excerpt = _files.read_tail_lines(ledger_path, limit=5)
     state_payload = _read_json(state_path)
     context_payload = _format_context_files(context_paths)
-    user_content = (
-        "Current desires markdown:\n"
-        f"{current_desires or '[none]'}\n\n"
-        "Recent ledger entries (most recent last):\n"
-        f"{ledger_excerpt or '[none]'}\n\n"
-        "Current state snapshot JSON:\n"
-        f"{json.dumps(state_payload, indent=2, sort_keys=True) if state_payload else '[none]'}\n\n"
-        f"{context_payload}\n\n"
-        "Update the desires markdown to reflect the next self-evolution steps. "
-        "Return ONLY valid JSON with keys: "
-        "`desires` (string markdown list) and optional `files` (list of "
-        "{path, content} objects). Use paths relative to the desires file "
-        "directory. When making code changes, include updated tests. "
-        "Do not include commentary or code fences."
+    state_json = ""
+    if state_payload:
+        state_json = _json.dumps(state_payload, indent=True, sort_keys=True).decode("utf-8")
+    user_content = _USER_TEMPLATE.format_map(
+        {
+            "desires": current_desires or "[none]",
+            "ledger": ledger_excerpt or "[none]",
+            "state": state_json or "[none]",
+            "context": context_payload,
+        }
     )
     return [
-        {
-            "role": "system",
-            "content": (
-                "You are CHORUS running a self-evolution loop. "
-                "Rewrite the desires list to guide the next iteration."
-            ),
-        },
+        {"role": "system", "content": _SYSTEM_PROMPT},
         {"role": "user", "content": user_content},
     ]
 
@@ -296,6 +567,7 @@ def _apply_response(
     *,
     current_desires: str,
     desires_path: str | Path,
+    base_dir: Path,
     ledger_path: str | Path,
     state_path: str | Path,
     source: str,
@@ -305,19 +577,20 @@ def _apply_response(
         timestamp = datetime.now(timezone.utc).isoformat()
         return "invalid", timestamp, error or "Response did not contain a desires payload."
 
-    desires_markdown = _normalize_desires_text(payload.desires)
+    desires_markdown, desires = _normalize_desires_text(payload.desires)
     if not desires_markdown.strip():
         timestamp = datetime.now(timezone.utc).isoformat()
         return "invalid", timestamp, "Response JSON must include a non-empty 'desires' string."
     if desires_markdown.strip() == current_desires.strip():
-        _write_files(payload.files, base_dir=_base_dir(desires_path))
+        _write_files(payload.files, base_dir=base_dir)
         timestamp = datetime.now(timezone.utc).isoformat()
         return "unchanged", timestamp, None
 
-    try:
-        desires = parse_desires(desires_markdown)
-    except Exception:
-        desires = []
+    if desires is None:
+        try:
+            desires = parse_desires(desires_markdown)
+        except Exception:
+            desires = []
     if not desires:
         timestamp = datetime.now(timezone.utc).isoformat()
         return (
@@ -326,10 +599,11 @@ def _apply_response(
             "Desires must be a numbered list like '1) Title'.",
         )
 
-    Path(desires_path).write_text(desires_markdown.strip() + "\n", encoding="utf-8")
-    _write_files(payload.files, base_dir=_base_dir(desires_path))
-    _, snapshot = materialize_expansion(
-        desires_path,
+    _files.atomic_write(desires_path, (desires_markdown.strip() + "\n").encode("utf-8"))
+    _write_files(payload.files, base_dir=base_dir)
+    # The desires were parsed above; don't read the file back just to parse it again.
+    _, snapshot = materialize_desires(
+        desires,
         ledger_path=ledger_path,
         state_path=state_path,
         source=source,
@@ -338,25 +612,18 @@ def _apply_response(
 
 
 def _read_text(path: str | Path) -> str:
-    file_path = Path(path)
-    if not file_path.exists():
-        return ""
-    return file_path.read_text(encoding="utf-8").strip()
-
-
-def _read_tail_lines(path: str | Path, *, limit: int) -> str:
-    file_path = Path(path)
-    if not file_path.exists():
+    try:
+        return Path(path).read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
         return ""
-    lines = file_path.read_text(encoding="utf-8").splitlines()
-    return "\n".join(lines[-limit:])
 
 
 def _read_json(path: str | Path) -> dict[str, object] | None:
-    file_path = Path(path)
-    if not file_path.exists():
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
         return None
-    return json.loads(file_path.read_text(encoding="utf-8"))
+    return _json.loads(data)
 
 
 def _format_context_files(context_paths: Sequence[str | Path] | None) -> str:
@@ -365,10 +632,11 @@ def _format_context_files(context_paths: Sequence[str | Path] | None) -> str:
     sections: list[str] = ["Context files:"]
     for context_path in context_paths:
         file_path = Path(context_path)
-        if not file_path.exists():
+        try:
+            content = file_path.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
             sections.append(f"- {file_path}: [missing]")
             continue
-        content = file_path.read_text(encoding="utf-8").strip()
         if not content:
             content = "[empty]"
         sections.append(f"--- {file_path} ---\n{content}")
@@ -394,8 +662,8 @@ def _parse_response_payload(
     candidate = _extract_json_candidate(stripped)
     if candidate:
         try:
-            data = json.loads(candidate)
-        except json.JSONDecodeError:
+            data = _json.loads(candidate)
+        except _json.JSONDecodeError:
             recovered = _recover_payload_from_invalid_json(candidate)
             if recovered is not None:
                 return recovered, None
@@ -434,7 +702,7 @@ def _parse_response_payload(
 def _extract_json_candidate(response: str) -> str | None:
     if response.startswith("{"):
         return response
-    fence_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", response, re.DOTALL)
+    fence_match = _FENCE_RE.search(response)
     if fence_match:
         return fence_match.group(1).strip()
     start = response.find("{")
@@ -452,7 +720,7 @@ def _recover_payload_from_invalid_json(response: str) -> EvolutionPayload | None
 
 
 def _recover_desires_text(response: str) -> str | None:
-    match = re.search(r'"desires"\s*:', response)
+    match = _DESIRES_KEY_RE.search(response)
     if not match:
         return None
     index = match.end()
@@ -510,16 +778,17 @@ def _recover_desires_text(response: str) -> str | None:
     return recovered or None
 
 
-def _normalize_desires_text(desires: str) -> str:
+def _normalize_desires_text(desires: str) -> tuple[str, list[Desire] | None]:
     stripped = desires.strip()
     if not stripped:
-        return ""
-    if parse_desires(stripped):
-        return stripped
+        return "", None
+    parsed = parse_desires(stripped)
+    if parsed:
+        return stripped, parsed
     items = _extract_list_items(stripped.splitlines())
     if items:
-        return _numbered_list(items)
-    return _normalize_single_desire(stripped)
+        return _numbered_list(items), None
+    return _normalize_single_desire(stripped), None
 
 
 def _normalize_single_desire(text: str) -> str:
@@ -534,7 +803,7 @@ def _normalize_single_desire(text: str) -> str:
 def _extract_list_items(lines: Sequence[str]) -> list[str]:
     items: list[str] = []
     for line in lines:
-        match = re.match(r"^\s*[-*•]\s+(.*)$", line)
+        match = _BULLET_RE.match(line)
         if match:
             text = match.group(1).strip()
             if text:
@@ -543,24 +812,45 @@ def _extract_list_items(lines: Sequence[str]) -> list[str]:
 
 
 def _numbered_list(items: Sequence[str]) -> str:
-    return "\n".join(f"{index}) {item.strip()}" for index, item in enumerate(items, start=1))
+    # join() materializes its argument anyway, so hand it a list rather than a generator.
+    return "\n".join([f"{index}) {item.strip()}" for index, item in enumerate(items, start=1)])
 
 
 def _write_files(files: list[dict[str, str]], *, base_dir: Path) -> None:
+    root = os.fspath(base_dir)
+    # Whether each destination directory really lives under root, resolved once per directory.
+    parents: dict[str, bool] = {}
     for item in files:
         relative_path = item["path"]
         content = item["content"]
-        destination = (base_dir / relative_path).resolve()
-        if base_dir not in destination.parents and destination != base_dir:
+        destination = os.path.normpath(os.path.join(root, relative_path))
+        if not _is_within(root, destination):
             raise ValueError(f"Refusing to write outside base directory: {relative_path}")
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_text(content, encoding="utf-8")
+        parent = os.path.dirname(destination)
+        inside = parents.get(parent)
+        if inside is None:
+            inside = parents[parent] = _is_within(root, os.path.realpath(parent))
+        if not inside or (
+            os.path.islink(destination)
+            and not _is_within(root, os.path.realpath(destination))
+        ):
+            raise ValueError(f"Refusing to write outside base directory: {relative_path}")
+        os.makedirs(parent, exist_ok=True)
+        Path(destination).write_text(content, encoding="utf-8")
+
+
+def _is_within(root: str, path: str) -> bool:
+    return os.path.commonpath([root, path]) == root
 
 
 def _base_dir(desires_path: str | Path) -> Path:
     return Path(desires_path).resolve().parent
 
 
+# Bootstrap modules by path, reused until the source bytes change.
+_BOOTSTRAP_CACHE: dict[str, tuple[bytes, types.ModuleType]] = {}
+
+
 def _maybe_run_bootstrap(
     bootstrap_path: str | Path | None,
     *,
@@ -570,16 +860,23 @@ def _maybe_run_bootstrap(
     state_path: str | Path,
     session_log_path: str | Path,
     source: str,
+    base_dir: Path,
 ) -> None:
     if bootstrap_path is None:
         return
     path = Path(bootstrap_path)
-    if not path.exists():
+    try:
+        code = path.read_bytes()
+    except FileNotFoundError:
         return
-    module_name = f"chorus_bootstrap_{iteration}"
-    module = types.ModuleType(module_name)
-    source = path.read_text(encoding="utf-8")
-    exec(compile(source, str(path), "exec"), module.__dict__)
+    key = str(path)
+    cached = _BOOTSTRAP_CACHE.get(key)
+    if cached is not None and cached[0] == code:
+        module = cached[1]
+    else:
+        module = types.ModuleType(f"chorus_bootstrap_{iteration}")
+        exec(compile(code, key, "exec"), module.__dict__)
+        _BOOTSTRAP_CACHE[key] = (code, module)
     bootstrap = getattr(module, "bootstrap", None)
     if not callable(bootstrap):
         raise ValueError("Bootstrap module must define a callable 'bootstrap' function")
@@ -590,6 +887,6 @@ def _maybe_run_bootstrap(
         "state_path": str(state_path),
         "session_log_path": str(session_log_path),
         "source": source,
-        "base_dir": str(_base_dir(desires_path)),
+        "base_dir": str(base_dir),
     }
     bootstrap(context)
@@ -4,12 +4,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import os
 from pathlib import Path
 import re
 
+from chorus import _files, _json
 from chorus.ledger import Ledger, LedgerEntry
 from chorus.state import StateSnapshot, export_state
 
+# Headers are lines like "1) Title" or "2. Title". A body-line match is one line
+# with surrounding whitespace trimmed, since "." never crosses a newline.
+_DESIRE_RE = re.compile(r"^[^\S\n]*(\d+)[).][^\S\n]+(.*\S)", re.MULTILINE)
+_BODY_LINE_RE = re.compile(r"\S(?:.*\S)?")
+# Every line boundary str.splitlines() recognizes; they are folded to "\n" first.
+_LINE_BREAK_RE = re.compile(r"\r\n?|[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
 
 @dataclass(frozen=True)
 class Desire:
@@ -19,28 +28,20 @@ class Desire:
 
 
 def parse_desires(text: str) -> list[Desire]:
+    text = _LINE_BREAK_RE.sub("\n", text)
+    headers = list(_DESIRE_RE.finditer(text))
     desires: list[Desire] = []
-    current: dict[str, object] | None = None
-    for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            if current and current["body_lines"]:
-                current["body_lines"].append("")
-            continue
-        match = re.match(r"^(\d+)[\).]\s+(.*)$", stripped)
-        if match:
-            if current:
-                desires.append(_finalize_desire(current))
-            current = {
-                "index": int(match.group(1)),
-                "title": match.group(2).strip(),
-                "body_lines": [],
-            }
-            continue
-        if current:
-            current["body_lines"].append(stripped)
-    if current:
-        desires.append(_finalize_desire(current))
+    for position, match in enumerate(headers):
+        # A desire's body runs from the end of its header line to the next header.
+        end = headers[position + 1].start() if position + 1 < len(headers) else len(text)
+        body_lines = _BODY_LINE_RE.findall(text, match.end(), end)
+        desires.append(
+            Desire(
+                index=int(match.group(1)),
+                title=match.group(2),
+                body="\n".join(body_lines),
+            )
+        )
     return desires
 
 
@@ -107,28 +108,85 @@ def materialize_expansion(
     state_path: str | Path,
     source: str,
     clock: datetime | None = None,
+    replace: bool = False,
 ) -> tuple[Ledger, StateSnapshot]:
-    ledger, snapshot = expand_from_desires_file(
-        desires_path,
+    text = Path(desires_path).read_text(encoding="utf-8")
+    return materialize_desires(
+        parse_desires(text),
+        ledger_path=ledger_path,
+        state_path=state_path,
         source=source,
         clock=clock,
+        replace=replace,
     )
-    ledger_output = "\n".join(entry.to_ledger_line() for entry in ledger.entries)
+
+
+def materialize_desires(
+    desires: list[Desire],
+    *,
+    ledger_path: str | Path,
+    state_path: str | Path,
+    source: str,
+    clock: datetime | None = None,
+    replace: bool = False,
+) -> tuple[Ledger, StateSnapshot]:
+    """Record ``desires`` in the ledger and export them as the state snapshot.
+
+    The ledger is append-only: only desires that are new or changed since the
+    previous state snapshot get entries, so re-materializing the same desires
+    appends nothing. ``replace`` rewrites the ledger with an entry per desire.
+    The returned ledger holds the entries that were written.
+    """
     ledger_destination = Path(ledger_path)
+    pending = desires
+    last_byte = b""
+    if not replace:
+        last_byte = _last_byte(ledger_destination)
+        # A missing or emptied ledger no longer holds what the snapshot recorded.
+        if last_byte:
+            recorded = _snapshot_desires(state_path)
+            pending = [desire for desire in desires if (desire.title, desire.body) not in recorded]
+    ledger = build_expansion_ledger(pending, source=source, clock=clock)
+    snapshot = build_expansion_state(desires, clock=clock)
+    ledger_output = "".join(f"{entry.to_ledger_line()}\n" for entry in ledger.iter_entries())
+    ledger_bytes = ledger_output.encode("utf-8")
     ledger_destination.parent.mkdir(parents=True, exist_ok=True)
-    with ledger_destination.open("w", encoding="utf-8") as handle:
-        handle.write(ledger_output)
-        if ledger_output:
-            handle.write("\n")
+    if replace:
+        _files.atomic_write(ledger_destination, ledger_bytes)
+    else:
+        if ledger_bytes and last_byte not in (b"", b"\n"):
+            # Keep a hand-edited final line from merging with the first new entry.
+            ledger_bytes = b"\n" + ledger_bytes
+        with ledger_destination.open("ab") as handle:
+            handle.write(ledger_bytes)
     export_state(state_path, snapshot)
     return ledger, snapshot
 
 
-def _finalize_desire(current: dict[str, object]) -> Desire:
-    body_lines = [line for line in current["body_lines"] if line != ""]
-    body = "\n".join(body_lines).strip()
-    return Desire(
-        index=int(current["index"]),
-        title=str(current["title"]),
-        body=body,
-    )
+def _last_byte(path: Path) -> bytes:
+    try:
+        with path.open("rb") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            if not size:
+                return b""
+            handle.seek(size - 1)
+            return handle.read(1)
+    except FileNotFoundError:
+        return b""
+
+
+def _snapshot_desires(state_path: str | Path) -> set[tuple[str, str]]:
+    try:
+        payload = _json.loads(Path(state_path).read_bytes())
+    except (FileNotFoundError, ValueError):
+        return set()
+    # Anything that is not an expansion snapshot counts as "no desires recorded".
+    state = payload.get("state") if isinstance(payload, dict) else None
+    desires = state.get("desires") if isinstance(state, dict) else None
+    if not isinstance(desires, list):
+        return set()
+    return {
+        (desire.get("title"), desire.get("body"))
+        for desire in desires
+        if isinstance(desire, dict)
+    }
@@ -5,7 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+import re
+from typing import Iterable, Iterator
 
 ALLOWED_ENTRY_TYPES = {
     "FACT",
@@ -18,6 +19,9 @@ ALLOWED_ENTRY_TYPES = {
     "ASSUMPTION",
 }
 
+_LEDGER_FIELDS = ("ts", "type", "topic", "content", "source")
+_FIELD_RE = re.compile(r'\s*(\w+)\s*:\s*"((?:[^"\\]|\\.)*)"\s*(?:,|\Z)', re.DOTALL)
+
 
 @dataclass(frozen=True)
 class LedgerEntry:
@@ -79,6 +83,9 @@ class Ledger:
     def entries(self) -> list[LedgerEntry]:
         return list(self._entries)
 
+    def iter_entries(self) -> Iterator[LedgerEntry]:
+        return iter(self._entries)
+
     def append(self, entry: LedgerEntry) -> None:
         entry.validate()
         self._entries.append(entry)
@@ -102,15 +109,19 @@ def parse_ledger_line(line: str) -> LedgerEntry:
     if not trimmed.startswith("- {") or not trimmed.endswith("}"):
         raise ValueError("Invalid ledger line format")
     payload = trimmed[3:-1]
-    parts = _split_quoted_fields(payload)
     values: dict[str, str] = {}
-    for part in parts:
-        key, raw = part.split(":", 1)
-        key = key.strip()
-        raw_value = raw.strip()
-        if not (raw_value.startswith("\"") and raw_value.endswith("\"")):
-            raise ValueError("Ledger values must be quoted")
-        values[key] = _unescape(raw_value[1:-1])
+    position = 0
+    for match in _FIELD_RE.finditer(payload):
+        # Fields must be contiguous; anything skipped between matches is malformed.
+        if match.start() != position:
+            break
+        values[match.group(1)] = _unescape(match.group(2))
+        position = match.end()
+    if position != len(payload):
+        raise ValueError("Ledger values must be quoted")
+    missing = [name for name in _LEDGER_FIELDS if name not in values]
+    if missing:
+        raise ValueError(f"Ledger line is missing fields: {', '.join(missing)}")
     entry = LedgerEntry(
         ts=values["ts"],
         type=values["type"],
@@ -123,38 +134,11 @@ def parse_ledger_line(line: str) -> LedgerEntry:
 
 
 def _escape(value: str) -> str:
+    # Most fields contain neither character; the membership tests are cheaper than replace.
+    if "\\" not in value and "\"" not in value:
+        return value
     return value.replace("\\", "\\\\").replace("\"", "\\\"")
 
 
 def _unescape(value: str) -> str:
     return value.replace("\\\"", "\"").replace("\\\\", "\\")
-
-
-def _split_quoted_fields(payload: str) -> list[str]:
-    fields: list[str] = []
-    current: list[str] = []
-    in_quotes = False
-    escape = False
-    for char in payload:
-        if escape:
-            current.append(char)
-            escape = False
-            continue
-        if char == "\\":
-            current.append(char)
-            escape = True
-            continue
-        if char == "\"":
-            current.append(char)
-            in_quotes = not in_quotes
-            continue
-        if char == "," and not in_quotes:
-            fields.append("".join(current).strip())
-            current = []
-            continue
-        current.append(char)
-    if in_quotes:
-        raise ValueError("Unterminated quoted value in ledger line")
-    if current:
-        fields.append("".join(current).strip())
-    return fields
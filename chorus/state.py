@@ -6,7 +6,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
-import json
+
+from chorus import _files, _json
 
 
 @dataclass(frozen=True)
@@ -24,11 +25,17 @@ class StateSnapshot:
 def export_state(path: str | Path, snapshot: StateSnapshot) -> Path:
     state_path = Path(path)
     state_path.parent.mkdir(parents=True, exist_ok=True)
+    # Only the data decides whether to rewrite; the timestamp differs on every call.
+    try:
+        previous = _json.loads(state_path.read_bytes())
+    except (FileNotFoundError, ValueError):
+        previous = None
+    if isinstance(previous, dict) and previous.get("state") == snapshot.data:
+        return state_path
     payload = {
         "timestamp": snapshot.timestamp,
         "state": snapshot.data,
     }
-    with state_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, sort_keys=True)
-        handle.write("\n")
+    data = _json.dumps(payload, indent=True, sort_keys=True) + b"\n"
+    _files.atomic_write(state_path, data)
     return state_path
@@ -0,0 +1,90 @@
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+# Import the package up front so collection pays the import cost once.
+import chorus.cli  # noqa: F401
+import chorus.continuity  # noqa: F401
+import chorus.daemon  # noqa: F401
+import chorus.dialogue  # noqa: F401
+import chorus.evolution  # noqa: F401
+import chorus.expansion  # noqa: F401
+import chorus.ledger  # noqa: F401
+import chorus.state  # noqa: F401
+from tests.helpers import CLOCKS
+
+_SHM_DIR = "/dev/shm"
+_CLOCK_MODULES = (
+    "chorus.continuity",
+    "chorus.daemon",
+    "chorus.evolution",
+    "chorus.expansion",
+    "chorus.ledger",
+    "chorus.state",
+)
+_shm_basetemp = pytest.StashKey[str]()
+
+
+def pytest_configure(config):
+    # Keep tmp_path in RAM on Linux unless the caller chose a basetemp.
+    if config.option.basetemp or not sys.platform.startswith("linux"):
+        return
+    if not os.access(_SHM_DIR, os.W_OK):
+        return
+    basetemp = tempfile.mkdtemp(prefix="chorus-pytest-", dir=_SHM_DIR)
+    config.option.basetemp = basetemp
+    config.stash[_shm_basetemp] = basetemp
+
+
+def pytest_unconfigure(config):
+    basetemp = config.stash.get(_shm_basetemp, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def chorus_template(tmp_path_factory):
+    template = tmp_path_factory.mktemp("template")
+    (template / "desires.md").write_text("1) Continuity\nSteady.\n", encoding="utf-8")
+    return template
+
+
+@pytest.fixture
+def chorus_paths(tmp_path, chorus_template):
+    desires_path = tmp_path / "desires.md"
+    shutil.copyfile(chorus_template / "desires.md", desires_path)
+    return SimpleNamespace(
+        desires_path=desires_path,
+        ledger_path=tmp_path / "ledger.md",
+        state_path=tmp_path / "state.json",
+        session_log_path=tmp_path / "session.jsonl",
+    )
+
+
+@pytest.fixture
+def fast_sleep(monkeypatch):
+    # Pacing between loop iterations is not under test; skip the real waits.
+    # Patch the names chorus looks up, not time.sleep itself, so pytest, watchfiles
+    # and the test HTTP servers keep the real clock.
+    monkeypatch.setattr("chorus.daemon.watchfiles", None)
+    monkeypatch.setattr("chorus.daemon.sleep", lambda _seconds: None)
+    monkeypatch.setattr("chorus.evolution.sleep", lambda _seconds: None)
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    fixed = CLOCKS[1]
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return fixed.astimezone(tz) if tz is not None else fixed.replace(tzinfo=None)
+
+    for module in _CLOCK_MODULES:
+        monkeypatch.setattr(f"{module}.datetime", FrozenDatetime)
+    return fixed
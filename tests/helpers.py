@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+
+# Fixed, immutable clocks for the first week of 2026, keyed by day of month.
+CLOCKS = {day: datetime(2026, 1, day, tzinfo=timezone.utc) for day in range(1, 8)}
+
+
+def head_lines(path: Path, n: int) -> list[str]:
+    with path.open(encoding="utf-8") as handle:
+        return [line.rstrip("\n") for line in islice(handle, n)]
+
+
+def seed_files(files: dict[Path, bytes]) -> None:
+    for path, data in files.items():
+        path.write_bytes(data)
+
+
+def line_count(path: Path) -> int:
+    with path.open("rb") as handle:
+        return sum(1 for _ in handle)
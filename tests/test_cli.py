@@ -1,100 +1,83 @@
+import logging
+
+import pytest
+
 from chorus.cli import main
 from chorus.evolution import LmStudioRequestError
+from tests.helpers import line_count
 
 
-def test_cli_expand(tmp_path, capsys):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Continuity\nSteady.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-
+def test_cli_expand(chorus_paths, capfdbinary):
     result = main(
         [
             "expand",
-            str(desires_path),
-            str(ledger_path),
-            str(state_path),
+            str(chorus_paths.desires_path),
+            str(chorus_paths.ledger_path),
+            str(chorus_paths.state_path),
             "--source",
             "test",
         ]
     )
 
-    captured = capsys.readouterr()
+    captured = capfdbinary.readouterr()
     assert result == 0
-    assert "Expansion materialized" in captured.out
-    assert ledger_path.exists()
-    assert state_path.exists()
+    assert b"Expansion materialized" in captured.out
+    assert chorus_paths.ledger_path.exists()
+    assert chorus_paths.state_path.exists()
 
 
-def test_cli_bootstrap(tmp_path, capsys):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Continuity\nLedger.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
-
+def test_cli_bootstrap(chorus_paths, capfdbinary):
     result = main(
         [
             "bootstrap",
-            str(desires_path),
-            str(ledger_path),
-            str(state_path),
-            str(session_log_path),
+            str(chorus_paths.desires_path),
+            str(chorus_paths.ledger_path),
+            str(chorus_paths.state_path),
+            str(chorus_paths.session_log_path),
             "--source",
             "test",
         ]
     )
 
-    captured = capsys.readouterr()
+    captured = capfdbinary.readouterr()
     assert result == 0
-    assert "Bootstrap complete" in captured.out
-    assert session_log_path.exists()
-
+    assert b"Bootstrap complete" in captured.out
+    assert chorus_paths.session_log_path.exists()
 
-def test_cli_expand_with_flag_paths(tmp_path, capsys):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Continuity\nSteady.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
 
+def test_cli_expand_with_flag_paths(chorus_paths, capfdbinary):
     result = main(
         [
             "expand",
             "--desires_path",
-            str(desires_path),
+            str(chorus_paths.desires_path),
             "--ledger-path",
-            str(ledger_path),
+            str(chorus_paths.ledger_path),
             "--state_path",
-            str(state_path),
+            str(chorus_paths.state_path),
             "--source",
             "test",
         ]
     )
 
-    captured = capsys.readouterr()
+    captured = capfdbinary.readouterr()
     assert result == 0
-    assert "Expansion materialized" in captured.out
-    assert ledger_path.exists()
-    assert state_path.exists()
+    assert b"Expansion materialized" in captured.out
+    assert chorus_paths.ledger_path.exists()
+    assert chorus_paths.state_path.exists()
 
 
-def test_cli_dialogue(tmp_path, capsys):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Continuity\nSteady.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
-
+def test_cli_dialogue(chorus_paths, capfdbinary):
     def completion_provider(_messages):
         return "Hello from CHORUS"
 
     result = main(
         [
             "dialogue",
-            str(desires_path),
-            str(ledger_path),
-            str(state_path),
-            str(session_log_path),
+            str(chorus_paths.desires_path),
+            str(chorus_paths.ledger_path),
+            str(chorus_paths.state_path),
+            str(chorus_paths.session_log_path),
             "Hello",
             "--source",
             "test",
@@ -102,29 +85,23 @@ def test_cli_dialogue(tmp_path, capsys):
         completion_provider=completion_provider,
     )
 
-    captured = capsys.readouterr()
+    captured = capfdbinary.readouterr()
     assert result == 0
-    assert "Hello from CHORUS" in captured.out
-    assert session_log_path.exists()
-
+    assert b"Hello from CHORUS" in captured.out
+    assert chorus_paths.session_log_path.exists()
 
-def test_cli_dialogue_handles_lm_studio_error(tmp_path, capsys):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Continuity\nSteady.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
 
+def test_cli_dialogue_handles_lm_studio_error(chorus_paths, capfdbinary):
     def completion_provider(_messages):
         raise LmStudioRequestError("LM Studio request failed.")
 
     result = main(
         [
             "dialogue",
-            str(desires_path),
-            str(ledger_path),
-            str(state_path),
-            str(session_log_path),
+            str(chorus_paths.desires_path),
+            str(chorus_paths.ledger_path),
+            str(chorus_paths.state_path),
+            str(chorus_paths.session_log_path),
             "Hello",
             "--source",
             "test",
@@ -132,6 +109,74 @@ def test_cli_dialogue_handles_lm_studio_error(tmp_path, capsys):
         completion_provider=completion_provider,
     )
 
-    captured = capsys.readouterr()
+    captured = capfdbinary.readouterr()
     assert result == 1
-    assert "LM Studio request failed." in captured.err
+    assert b"LM Studio request failed." in captured.err
+
+
+def test_cli_reports_missing_paths(chorus_paths, capfdbinary):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["expand", str(chorus_paths.desires_path), "--source", "test"])
+
+    assert excinfo.value.code == 2
+    assert b"Missing required paths: ledger_path, state_path" in capfdbinary.readouterr().err
+
+
+def test_cli_flag_paths_override_positional_paths(chorus_paths, tmp_path):
+    result = main(
+        [
+            "expand",
+            "--ledger-path",
+            str(chorus_paths.ledger_path),
+            str(chorus_paths.desires_path),
+            str(tmp_path / "ignored.md"),
+            str(chorus_paths.state_path),
+            "--source",
+            "test",
+        ]
+    )
+
+    assert result == 0
+    assert chorus_paths.ledger_path.exists()
+    assert not (tmp_path / "ignored.md").exists()
+
+
+@pytest.mark.parametrize("extra", [[], ["--replace"]])
+def test_cli_expand_twice_keeps_one_entry_per_desire(chorus_paths, extra):
+    argv = [
+        "expand",
+        str(chorus_paths.desires_path),
+        str(chorus_paths.ledger_path),
+        str(chorus_paths.state_path),
+        "--source",
+        "test",
+    ]
+
+    assert main(argv) == 0
+    assert main(argv + extra) == 0
+    assert line_count(chorus_paths.ledger_path) == 1
+
+
+def test_cli_evolve_prints_progress_to_stdout(chorus_paths, capfdbinary):
+    logger = logging.getLogger("chorus.evolution")
+
+    result = main(
+        [
+            "evolve",
+            str(chorus_paths.desires_path),
+            str(chorus_paths.ledger_path),
+            str(chorus_paths.state_path),
+            str(chorus_paths.session_log_path),
+            "--source",
+            "test",
+            "--max-iterations",
+            "1",
+        ],
+        completion_provider=lambda _messages: '{"desires": "1) Next Step\\nAdvance.\\n"}',
+    )
+
+    output = capfdbinary.readouterr().out
+    assert result == 0
+    assert b"Iteration 1 completed with status=updated." in output
+    assert logger.handlers == []
+    assert logger.level == logging.NOTSET
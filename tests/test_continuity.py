@@ -1,11 +1,21 @@
-from datetime import datetime, timezone
 import json
+import os
 
-from chorus.continuity import bootstrap_continuity, load_interactions, record_interaction
+import pytest
+
+from chorus.continuity import (
+    InteractionRecord,
+    append_interactions,
+    bootstrap_continuity,
+    load_interaction_columns,
+    load_interactions,
+    record_interaction,
+)
+from tests.helpers import CLOCKS
 
 
 def test_record_and_load_interactions(tmp_path):
-    clock = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    clock = CLOCKS[6]
     log_path = tmp_path / "session.jsonl"
 
     record_interaction(
@@ -28,7 +38,7 @@ def test_record_and_load_interactions(tmp_path):
 
 
 def test_record_interaction_normalizes_empty_content(tmp_path):
-    clock = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    clock = CLOCKS[6]
     log_path = tmp_path / "session.jsonl"
 
     record_interaction(
@@ -44,7 +54,7 @@ def test_record_interaction_normalizes_empty_content(tmp_path):
 
 
 def test_bootstrap_continuity(tmp_path):
-    clock = datetime(2026, 1, 7, tzinfo=timezone.utc)
+    clock = CLOCKS[7]
     desires_path = tmp_path / "desires.md"
     desires_path.write_text("1) Continuity Hardening\nLedger-first growth.\n", encoding="utf-8")
     ledger_path = tmp_path / "ledger.md"
@@ -62,7 +72,136 @@ def test_bootstrap_continuity(tmp_path):
 
     assert record.role == "system"
     assert timestamp == clock.isoformat()
-    log_lines = session_log_path.read_text(encoding="utf-8").strip().splitlines()
-    assert len(log_lines) == 1
-    payload = json.loads(log_lines[0])
-    assert payload["content"].startswith("Bootstrap continuity")
+    raw = session_log_path.read_bytes()
+    assert raw.count(b"\n") == 1
+    assert b'"content":"Bootstrap continuity' in raw
+
+
+def test_record_interaction_recreates_removed_log(tmp_path):
+    clock = CLOCKS[6]
+    log_path = tmp_path / "session.jsonl"
+
+    record_interaction(log_path, role="user", content="Hello", clock=clock)
+    log_path.unlink()
+    record_interaction(log_path, role="assistant", content="Again", clock=clock)
+
+    records = load_interactions(log_path)
+
+    assert [record.content for record in records] == ["Again"]
+
+
+def test_record_interaction_syncs_in_batches(tmp_path, monkeypatch):
+    import chorus.continuity as continuity
+
+    synced = []
+    # A private writer keeps handles left open by earlier tests from being evicted
+    # (and synced) into this count.
+    monkeypatch.setattr(continuity, "_LOG_WRITER", continuity._LogWriter())
+    monkeypatch.setattr(continuity, "SYNC_EVERY", 2)
+    monkeypatch.setattr(continuity, "_datasync", synced.append)
+    clock = CLOCKS[6]
+    log_path = tmp_path / "session.jsonl"
+
+    for content in ("one", "two", "three"):
+        record_interaction(log_path, role="user", content=content, clock=clock)
+
+    assert len(synced) == 1
+    assert len(load_interactions(log_path)) == 3
+
+
+def test_load_interaction_columns(tmp_path):
+    clock = CLOCKS[6]
+    log_path = tmp_path / "session.jsonl"
+    record_interaction(log_path, role="user", content="Hello", clock=clock)
+    record_interaction(log_path, role="assistant", content="Acknowledged", clock=clock)
+
+    timestamps, roles, contents = load_interaction_columns(log_path)
+
+    assert timestamps == [clock.isoformat(), clock.isoformat()]
+    assert roles == ["user", "assistant"]
+    assert contents == ["Hello", "Acknowledged"]
+    assert load_interaction_columns(tmp_path / "missing.jsonl") == ([], [], [])
+
+
+def test_load_interaction_columns_serves_recent_history_from_memory(tmp_path, monkeypatch):
+    import chorus.continuity as continuity
+
+    clock = CLOCKS[6]
+    log_path = tmp_path / "session.jsonl"
+    record_interaction(log_path, role="user", content="Hello", clock=clock)
+    load_interaction_columns(log_path, limit=2)
+    record_interaction(log_path, role="assistant", content="Acknowledged", clock=clock)
+
+    def fail_loads(_data):
+        raise AssertionError("session log should not be reparsed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(continuity._json, "loads", fail_loads)
+        _, roles, contents = load_interaction_columns(log_path, limit=2)
+
+    assert roles == ["user", "assistant"]
+    assert contents == ["Hello", "Acknowledged"]
+
+
+def test_load_interaction_columns_sees_external_appends(tmp_path):
+    clock = CLOCKS[6]
+    log_path = tmp_path / "session.jsonl"
+    record_interaction(log_path, role="user", content="Hello", clock=clock)
+    load_interaction_columns(log_path, limit=5)
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"ts": clock.isoformat(), "role": "system", "content": "External"}))
+        handle.write("\n")
+
+    _, _, contents = load_interaction_columns(log_path, limit=5)
+
+    assert contents == ["Hello", "External"]
+
+
+def test_load_interaction_columns_sees_appends_racing_our_write(tmp_path, monkeypatch):
+    import chorus.continuity as continuity
+
+    clock = CLOCKS[6]
+    log_path = tmp_path / "session.jsonl"
+    record_interaction(log_path, role="user", content="Hello", clock=clock)
+    load_interaction_columns(log_path, limit=5)
+    append = continuity._LOG_WRITER.append
+
+    def append_then_external_write(path, data, records=1):
+        before, _ = append(path, data, records)
+        # Another process appends between our write and the fstat that follows it.
+        with log_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps({"ts": clock.isoformat(), "role": "system", "content": "External"}))
+            handle.write("\n")
+        return before, continuity._identity(os.stat(path))
+
+    monkeypatch.setattr(continuity._LOG_WRITER, "append", append_then_external_write)
+    record_interaction(log_path, role="assistant", content="Acknowledged", clock=clock)
+
+    _, _, contents = load_interaction_columns(log_path, limit=5)
+
+    assert contents == ["Hello", "Acknowledged", "External"]
+
+
+def test_append_interactions_writes_records_together(tmp_path):
+    clock = CLOCKS[6]
+    log_path = tmp_path / "session.jsonl"
+    user = InteractionRecord.now(role="user", content="Hello", clock=clock)
+    assistant = InteractionRecord.now(role="assistant", content=" ", clock=clock)
+
+    append_interactions(log_path, [user, assistant])
+
+    records = load_interactions(log_path)
+    assert records == [user, assistant]
+    assert records[1].content == "[empty]"
+
+
+def test_append_interactions_rejects_invalid_batch(tmp_path):
+    clock = CLOCKS[6]
+    log_path = tmp_path / "session.jsonl"
+    valid = InteractionRecord.now(role="user", content="Hello", clock=clock)
+    invalid = InteractionRecord.now(role="narrator", content="Hi", clock=clock)
+
+    with pytest.raises(ValueError, match="Unsupported role"):
+        append_interactions(log_path, [valid, invalid])
+
+    assert not log_path.exists()
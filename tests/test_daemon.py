@@ -1,39 +1,41 @@
+import threading
+import time
+
+import pytest
+
 from chorus.daemon import run_daemon
+from tests.helpers import line_count
+
+pytestmark = pytest.mark.usefixtures("fast_sleep", "frozen_clock")
 
+_WATCH_DEADLINE = 30.0
 
-def test_daemon_bootstrap_and_unchanged(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Continuity\nStable.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
 
+def test_daemon_bootstrap_and_unchanged(chorus_paths, frozen_clock):
     results = run_daemon(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         source="test",
         interval=0.01,
         max_iterations=2,
     )
 
     assert [result.status for result in results] == ["bootstrapped", "unchanged"]
-    assert ledger_path.exists()
-    assert state_path.exists()
-    assert session_log_path.exists()
+    assert {result.timestamp for result in results} == {frozen_clock.isoformat()}
+    assert line_count(chorus_paths.ledger_path) == 1
+    assert chorus_paths.state_path.exists()
+    assert line_count(chorus_paths.session_log_path) == 1
 
 
-def test_daemon_rejects_non_positive_interval(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Continuity\nStable.\n", encoding="utf-8")
-
+def test_daemon_rejects_non_positive_interval(chorus_paths):
     try:
         run_daemon(
-            desires_path,
-            ledger_path=tmp_path / "ledger.md",
-            state_path=tmp_path / "state.json",
-            session_log_path=tmp_path / "session.jsonl",
+            chorus_paths.desires_path,
+            ledger_path=chorus_paths.ledger_path,
+            state_path=chorus_paths.state_path,
+            session_log_path=chorus_paths.session_log_path,
             source="test",
             interval=0.0,
             max_iterations=1,
@@ -42,3 +44,99 @@ def test_daemon_rejects_non_positive_interval(tmp_path):
         assert "Interval must be positive" in str(exc)
     else:
         raise AssertionError("Expected ValueError for non-positive interval.")
+
+
+def test_daemon_skips_hashing_unmodified_desires(chorus_paths, monkeypatch):
+    import chorus.daemon as daemon
+
+    reads = []
+    original = daemon._read_signature
+
+    def counting_read_signature(path):
+        reads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(daemon, "_read_signature", counting_read_signature)
+
+    results = run_daemon(
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
+        source="test",
+        interval=0.01,
+        max_iterations=3,
+    )
+
+    assert [result.status for result in results] == ["bootstrapped", "unchanged", "unchanged"]
+    assert len(reads) == 1
+
+
+def _run_daemon_in_thread(chorus_paths, **kwargs):
+    outcome = {}
+
+    def target():
+        outcome["results"] = run_daemon(
+            chorus_paths.desires_path,
+            ledger_path=chorus_paths.ledger_path,
+            state_path=chorus_paths.state_path,
+            session_log_path=chorus_paths.session_log_path,
+            source="test",
+            **kwargs,
+        )
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread, outcome
+
+
+def test_daemon_watch_honors_interval_despite_sibling_writes(chorus_paths, monkeypatch):
+    import chorus.daemon as daemon
+
+    monkeypatch.setattr(daemon, "watchfiles", pytest.importorskip("watchfiles"))
+    sibling = chorus_paths.desires_path.with_name("noise.txt")
+    thread, outcome = _run_daemon_in_thread(chorus_paths, interval=0.2, max_iterations=3)
+
+    # Constant sibling writes used to keep re-arming the watch timeout forever.
+    count = 0
+    deadline = time.monotonic() + _WATCH_DEADLINE
+    while thread.is_alive() and time.monotonic() < deadline:
+        count += 1
+        sibling.write_text(str(count), encoding="utf-8")
+        thread.join(0.02)
+
+    assert not thread.is_alive()
+    assert [result.status for result in outcome["results"]] == [
+        "bootstrapped",
+        "unchanged",
+        "unchanged",
+    ]
+
+
+def test_daemon_watch_wakes_on_desires_edit(chorus_paths, monkeypatch):
+    import chorus.daemon as daemon
+
+    monkeypatch.setattr(daemon, "watchfiles", pytest.importorskip("watchfiles"))
+    bootstrapped = threading.Event()
+    original = daemon.bootstrap_continuity
+
+    def bootstrap_and_signal(*args, **kwargs):
+        result = original(*args, **kwargs)
+        bootstrapped.set()
+        return result
+
+    monkeypatch.setattr(daemon, "bootstrap_continuity", bootstrap_and_signal)
+    thread, outcome = _run_daemon_in_thread(chorus_paths, interval=3600.0, max_iterations=2)
+    assert bootstrapped.wait(_WATCH_DEADLINE)
+
+    # Keep editing until the watcher (which registers asynchronously) reports one;
+    # only a wake from the watch can end the run before the hour-long interval.
+    edits = 0
+    deadline = time.monotonic() + _WATCH_DEADLINE
+    while thread.is_alive() and time.monotonic() < deadline:
+        edits += 1
+        chorus_paths.desires_path.write_text(f"1) Continuity\nEdit {edits}.\n", encoding="utf-8")
+        thread.join(0.1)
+
+    assert not thread.is_alive()
+    assert [result.status for result in outcome["results"]] == ["bootstrapped", "expanded"]
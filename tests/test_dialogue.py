@@ -1,75 +1,67 @@
 import pytest
 
+from chorus.continuity import record_interaction
 from chorus.dialogue import build_dialogue_messages, run_dialogue_turn
 from chorus.evolution import LmStudioRequestError
+from tests.helpers import head_lines, seed_files
 
+_LEDGER = b"[ledger]\n"
+_STATE = b'{"state": {"desire_count": 1}}\n'
 
-def test_build_dialogue_messages_includes_continuity_payloads(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Persist\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    ledger_path.write_text("[ledger]\n", encoding="utf-8")
-    state_path = tmp_path / "state.json"
-    state_path.write_text('{"state": {"desire_count": 1}}\n', encoding="utf-8")
-    session_log_path = tmp_path / "session.jsonl"
+
+def test_build_dialogue_messages_includes_continuity_payloads(chorus_paths, tmp_path):
     capsule_path = tmp_path / "capsule.md"
-    capsule_path.write_text("Capsule context", encoding="utf-8")
+    seed_files(
+        {
+            chorus_paths.ledger_path: _LEDGER,
+            chorus_paths.state_path: _STATE,
+            capsule_path: b"Capsule context",
+        }
+    )
 
     messages = build_dialogue_messages(
         "Hello",
-        desires_path=desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+        desires_path=chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         capsule_path=capsule_path,
         history_limit=0,
     )
 
     system_message = messages[0]["content"]
     assert "Capsule context" in system_message
-    assert "1) Persist" in system_message
+    assert "1) Continuity" in system_message
     assert "[ledger]" in system_message
     assert "desire_count" in system_message
 
 
-def test_run_dialogue_turn_records_interactions(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Persist\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    ledger_path.write_text("[ledger]\n", encoding="utf-8")
-    state_path = tmp_path / "state.json"
-    state_path.write_text('{"state": {"desire_count": 1}}\n', encoding="utf-8")
-    session_log_path = tmp_path / "session.jsonl"
+def test_run_dialogue_turn_records_interactions(chorus_paths):
+    seed_files({chorus_paths.ledger_path: _LEDGER, chorus_paths.state_path: _STATE})
 
     def completion_provider(_messages):
         return "Acknowledged"
 
     response = run_dialogue_turn(
         "Hello",
-        desires_path=desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+        desires_path=chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         capsule_path=None,
         history_limit=0,
         completion_provider=completion_provider,
     )
 
     assert response == "Acknowledged"
-    log_lines = session_log_path.read_text(encoding="utf-8").splitlines()
+    log_lines = head_lines(chorus_paths.session_log_path, 3)
     assert len(log_lines) == 2
     assert "Hello" in log_lines[0]
     assert "Acknowledged" in log_lines[1]
 
 
-def test_run_dialogue_turn_logs_lm_studio_errors(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Persist\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    ledger_path.write_text("[ledger]\n", encoding="utf-8")
-    state_path = tmp_path / "state.json"
-    state_path.write_text('{"state": {"desire_count": 1}}\n', encoding="utf-8")
-    session_log_path = tmp_path / "session.jsonl"
+def test_run_dialogue_turn_logs_lm_studio_errors(chorus_paths):
+    seed_files({chorus_paths.ledger_path: _LEDGER, chorus_paths.state_path: _STATE})
 
     def completion_provider(_messages):
         raise LmStudioRequestError("LM Studio request failed.")
@@ -77,15 +69,92 @@ def test_run_dialogue_turn_logs_lm_studio_errors(tmp_path):
     with pytest.raises(LmStudioRequestError):
         run_dialogue_turn(
             "Hello",
-            desires_path=desires_path,
-            ledger_path=ledger_path,
-            state_path=state_path,
-            session_log_path=session_log_path,
+            desires_path=chorus_paths.desires_path,
+            ledger_path=chorus_paths.ledger_path,
+            state_path=chorus_paths.state_path,
+            session_log_path=chorus_paths.session_log_path,
             capsule_path=None,
             history_limit=0,
             completion_provider=completion_provider,
         )
 
-    log_lines = session_log_path.read_text(encoding="utf-8").splitlines()
+    log_lines = head_lines(chorus_paths.session_log_path, 3)
     assert len(log_lines) == 2
     assert "Dialogue error" in log_lines[1]
+
+
+def test_run_dialogue_turn_keeps_user_message_on_interrupt(chorus_paths):
+    seed_files({chorus_paths.ledger_path: _LEDGER, chorus_paths.state_path: _STATE})
+
+    def completion_provider(_messages):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_dialogue_turn(
+            "Hello",
+            desires_path=chorus_paths.desires_path,
+            ledger_path=chorus_paths.ledger_path,
+            state_path=chorus_paths.state_path,
+            session_log_path=chorus_paths.session_log_path,
+            capsule_path=None,
+            history_limit=0,
+            completion_provider=completion_provider,
+        )
+
+    log_lines = head_lines(chorus_paths.session_log_path, 3)
+    assert len(log_lines) == 2
+    assert "Hello" in log_lines[0]
+    assert "Dialogue error: KeyboardInterrupt" in log_lines[1]
+
+
+def test_build_dialogue_messages_reads_ledger_tail(chorus_paths):
+    chorus_paths.ledger_path.write_text(
+        "".join(f"- entry {index:05d}\n" for index in range(2000)),
+        encoding="utf-8",
+    )
+
+    messages = build_dialogue_messages(
+        "Hello",
+        desires_path=chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
+        history_limit=0,
+    )
+
+    system_message = messages[0]["content"]
+    assert "- entry 01992" in system_message
+    assert "- entry 01999" in system_message
+    assert "- entry 01991" not in system_message
+
+
+def test_build_dialogue_messages_refreshes_after_file_changes(chorus_paths):
+    paths = vars(chorus_paths)
+
+    first = build_dialogue_messages("Hello", **paths)
+    assert build_dialogue_messages("Hello again", **paths)[0] == first[0]
+
+    chorus_paths.desires_path.write_text("1) Continuity\n2) Remember everything\n", encoding="utf-8")
+    refreshed = build_dialogue_messages("Hello", **paths)
+
+    assert "Remember everything" in refreshed[0]["content"]
+
+
+def test_build_dialogue_messages_limits_history(chorus_paths):
+    for index in range(5):
+        record_interaction(chorus_paths.session_log_path, role="user", content=f"turn {index}")
+
+    messages = build_dialogue_messages(
+        "Hello",
+        desires_path=chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
+        history_limit=2,
+    )
+
+    assert messages[1:] == [
+        {"role": "user", "content": "turn 3"},
+        {"role": "user", "content": "turn 4"},
+        {"role": "user", "content": "Hello"},
+    ]
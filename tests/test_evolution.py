@@ -1,175 +1,192 @@
-import pytest
-
-from chorus.evolution import _extract_chat_content, run_evolution_loop
-
-
-def test_evolution_loop_updates_desires(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import re
+import socket
+import threading
 
-    def completion_provider(_messages):
-        return '{"desires": "1) Next Step\\nAdvance.\\n"}'
+import pytest
 
+from chorus.evolution import (
+    LmStudioConfig,
+    LmStudioRequestError,
+    _extract_chat_content,
+    _write_files,
+    call_lm_studio_chat,
+    run_evolution_loop,
+    run_evolution_loop_async,
+)
+
+pytestmark = pytest.mark.usefixtures("fast_sleep", "frozen_clock")
+
+_ERROR_LINE_RE = re.compile(r"Iteration 1 error: LM Studio unreachable\. Raw response: \[none\]")
+
+
+@pytest.mark.parametrize(
+    ("response", "expected_lines"),
+    [
+        pytest.param('{"desires": "1) Next Step\\nAdvance.\\n"}', ["1) Next Step"], id="numbered"),
+        pytest.param('{"desires": "1. Next Step\\nAdvance.\\n"}', ["1. Next Step"], id="dot-numbered"),
+        pytest.param(
+            '{"desires": "Not a numbered list."}', ["1) Not a numbered list."], id="single-line"
+        ),
+        pytest.param('{"desires": "Unnumbered desire"}', ["1) Unnumbered desire"], id="unlisted"),
+        pytest.param(
+            '{"desires": "- First desire\\n- Second desire\\n"}',
+            ["1) First desire", "2) Second desire"],
+            id="bulleted",
+        ),
+        pytest.param(
+            '{"desires": ["First desire", "Second desire"]}',
+            ["1) First desire", "2) Second desire"],
+            id="json-list",
+        ),
+        pytest.param(
+            '```json\n{\n  "desires": "1) Next\\nAdvance.\\n"\n}\n```', ["1) Next"], id="fenced"
+        ),
+        pytest.param(
+            '```json\n{\n  "desires": "1) Next\\nAdvance.\\n"\n', ["1) Next"], id="truncated-fence"
+        ),
+        pytest.param(
+            '{\n  "desires": "- First desire\n- Second desire\n"\n}',
+            ["1) First desire", "2) Second desire"],
+            id="raw-newlines",
+        ),
+        pytest.param(
+            '{ "desires": "1) Handle path C:\\\\Users\\\\Dev\n2) Say "Hello"\n" }',
+            ["1) Handle path C:\\Users\\Dev", '2) Say "Hello"'],
+            id="quotes-and-slashes",
+        ),
+    ],
+)
+def test_evolution_loop_accepts_response(chorus_paths, response, expected_lines):
     results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         source="test",
         interval=0.01,
         max_iterations=1,
-        completion_provider=completion_provider,
+        completion_provider=lambda _messages: response,
     )
 
     assert [result.status for result in results] == ["updated"]
-    assert "Next Step" in desires_path.read_text(encoding="utf-8")
-    assert ledger_path.exists()
-    assert state_path.exists()
-    assert session_log_path.exists()
-
-
-def test_evolution_loop_logs_progress_to_stdout(tmp_path, capsys):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
-
-    def completion_provider(_messages):
+    contents = chorus_paths.desires_path.read_text(encoding="utf-8")
+    assert contents.startswith(expected_lines[0])
+    for line in expected_lines[1:]:
+        assert line in contents
+    assert chorus_paths.ledger_path.exists()
+    assert chorus_paths.state_path.exists()
+    assert chorus_paths.session_log_path.exists()
+
+
+def test_async_evolution_loop_updates_desires(chorus_paths):
+    async def completion_provider(_messages):
+        await asyncio.sleep(0)
         return '{"desires": "1) Next Step\\nAdvance.\\n"}'
 
-    run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
-        source="test",
-        interval=0.01,
-        max_iterations=1,
-        completion_provider=completion_provider,
+    results = asyncio.run(
+        run_evolution_loop_async(
+            chorus_paths.desires_path,
+            ledger_path=chorus_paths.ledger_path,
+            state_path=chorus_paths.state_path,
+            session_log_path=chorus_paths.session_log_path,
+            source="test",
+            interval=0.01,
+            max_iterations=2,
+            completion_provider=completion_provider,
+        )
     )
 
-    output = capsys.readouterr().out
-    assert "Self-evolution loop started." in output
-    assert "Iteration 1 started." in output
-    assert "Iteration 1 completed with status=updated." in output
+    assert [result.status for result in results] == ["updated", "unchanged"]
+    assert "Next Step" in chorus_paths.desires_path.read_text(encoding="utf-8")
+    assert chorus_paths.ledger_path.exists()
+    assert chorus_paths.state_path.exists()
 
 
-def test_evolution_loop_rejects_invalid_response(tmp_path, capsys):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
+def test_evolution_loop_caches_identical_prompts(chorus_paths):
+    calls = []
 
-    def completion_provider(_messages):
-        return '{"desires": "Not a numbered list."}'
+    def completion_provider(messages):
+        calls.append(messages)
+        return '{"desires": "1) Continuity\\nSteady.\\n"}'
 
     results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         source="test",
+        temperature=0.0,
         interval=0.01,
-        max_iterations=1,
+        max_iterations=3,
         completion_provider=completion_provider,
     )
 
-    assert [result.status for result in results] == ["updated"]
-    assert desires_path.read_text(encoding="utf-8").startswith("1) Not a numbered list.")
-    output = capsys.readouterr().out
-    assert "Iteration 1 completed with status=updated." in output
-
-
-def test_evolution_loop_normalizes_bulleted_desires(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
+    assert [result.status for result in results] == ["unchanged"] * 3
+    assert len(calls) == 1
+    assert chorus_paths.session_log_path.read_text(encoding="utf-8").count("cache hit") == 2
 
-    def completion_provider(_messages):
-        return '{"desires": "- First desire\\n- Second desire\\n"}'
-
-    results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+    run_evolution_loop(
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         source="test",
         interval=0.01,
-        max_iterations=1,
+        max_iterations=2,
         completion_provider=completion_provider,
     )
 
-    assert [result.status for result in results] == ["updated"]
-    contents = desires_path.read_text(encoding="utf-8")
-    assert contents.startswith("1) First desire")
-    assert "2) Second desire" in contents
+    assert len(calls) == 3
 
 
-def test_evolution_loop_accepts_dot_numbering(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
+def test_evolution_loop_logs_progress(chorus_paths, caplog):
+    caplog.set_level(logging.INFO, logger="chorus.evolution")
 
     def completion_provider(_messages):
-        return '{"desires": "1. Next Step\\nAdvance.\\n"}'
+        return '{"desires": "1) Next Step\\nAdvance.\\n"}'
 
-    results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+    run_evolution_loop(
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         source="test",
         interval=0.01,
         max_iterations=1,
         completion_provider=completion_provider,
     )
 
-    assert [result.status for result in results] == ["updated"]
-    contents = desires_path.read_text(encoding="utf-8")
-    assert contents.startswith("1. Next Step")
-
+    assert "Self-evolution loop started." in caplog.text
+    assert "Iteration 1 started." in caplog.text
+    assert "Iteration 1 completed with status=updated." in caplog.text
 
-def test_evolution_loop_normalizes_unlisted_desire(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
 
-    def completion_provider(_messages):
-        return '{"desires": "Unnumbered desire"}'
+def test_evolution_logger_is_left_to_the_application(chorus_paths, capfdbinary, caplog):
+    logger = logging.getLogger("chorus.evolution")
+    assert logger.handlers == []
+    assert logger.propagate
+    assert logger.level == logging.NOTSET
 
-    results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+    run_evolution_loop(
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         source="test",
         interval=0.01,
         max_iterations=1,
-        completion_provider=completion_provider,
+        completion_provider=lambda _messages: '{"desires": "1) Continuity\\nSteady.\\n"}',
     )
 
-    assert [result.status for result in results] == ["updated"]
-    contents = desires_path.read_text(encoding="utf-8")
-    assert contents.startswith("1) Unnumbered desire")
+    assert capfdbinary.readouterr().out == b""
+    assert [record for record in caplog.records if record.levelno < logging.WARNING] == []
 
 
-def test_evolution_loop_includes_context_files(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
+def test_evolution_loop_includes_context_files(chorus_paths, tmp_path):
     context_path = tmp_path / "context.txt"
     context_path.write_text("context payload", encoding="utf-8")
     captured = {}
@@ -179,10 +196,10 @@ def test_evolution_loop_includes_context_files(tmp_path):
         return '{"desires": "1) Next Step\\nAdvance.\\n"}'
 
     results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         source="test",
         interval=0.01,
         max_iterations=1,
@@ -197,73 +214,42 @@ def test_evolution_loop_includes_context_files(tmp_path):
     assert "context payload" in user_content
 
 
-def test_evolution_loop_accepts_json_desires_list(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
-
-    def completion_provider(_messages):
-        return '{\"desires\": [\"First desire\", \"Second desire\"]}'
-
-    results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
-        source="test",
-        interval=0.01,
-        max_iterations=1,
-        completion_provider=completion_provider,
+def test_evolution_loop_includes_ledger_tail(chorus_paths):
+    chorus_paths.ledger_path.write_text(
+        "".join(f"entry {index:05d}\n" for index in range(5000)),
+        encoding="utf-8",
     )
+    captured = {}
 
-    assert [result.status for result in results] == ["updated"]
-    contents = desires_path.read_text(encoding="utf-8")
-    assert contents.startswith("1) First desire")
-    assert "2) Second desire" in contents
-
-
-def test_evolution_loop_parses_fenced_json_payload(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
-
-    def completion_provider(_messages):
-        return '```json\n{\n  "desires": "1) Next\\nAdvance.\\n"\n}\n```'
+    def completion_provider(messages):
+        captured["user"] = messages[-1]["content"]
+        return '{"desires": "1) Continuity\\nSteady.\\n"}'
 
-    results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+    run_evolution_loop(
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         source="test",
         interval=0.01,
         max_iterations=1,
         completion_provider=completion_provider,
     )
 
-    assert [result.status for result in results] == ["updated"]
-    assert "1) Next" in desires_path.read_text(encoding="utf-8")
-
+    expected = "\n".join(f"entry {index:05d}" for index in range(4995, 5000))
+    assert f"(most recent last):\n{expected}\n\n" in captured["user"]
+    assert "entry 04994" not in captured["user"]
 
-def test_evolution_loop_logs_raw_response_on_error(tmp_path, capsys):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
 
+def test_evolution_loop_logs_raw_response_on_error(chorus_paths, caplog):
     def completion_provider(_messages):
         raise ValueError("LM Studio unreachable")
 
     results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         source="test",
         interval=0.01,
         max_iterations=1,
@@ -271,17 +257,10 @@ def test_evolution_loop_logs_raw_response_on_error(tmp_path, capsys):
     )
 
     assert [result.status for result in results] == ["error"]
-    output = capsys.readouterr().out
-    assert "error: LM Studio unreachable" in output
-    assert "Raw response: [none]" in output
+    assert _ERROR_LINE_RE.search(caplog.text)
 
 
-def test_evolution_loop_writes_files_and_reloads_bootstrap(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
+def test_evolution_loop_writes_files_and_reloads_bootstrap(chorus_paths, tmp_path):
     bootstrap_path = tmp_path / "bootstrap.py"
     marker_path = tmp_path / "marker.txt"
 
@@ -304,15 +283,15 @@ def test_evolution_loop_writes_files_and_reloads_bootstrap(tmp_path):
                 encoding="utf-8",
             )
         return (
-            '{\"desires\": \"1) Start\\nSeed.\\n\", '
+            '{\"desires\": \"1) Continuity\\nSteady.\\n\", '
             '\"files\": [{\"path\": \"notes.txt\", \"content\": \"updated\"}]}'
         )
 
     results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
         source="test",
         interval=0.01,
         max_iterations=2,
@@ -325,6 +304,59 @@ def test_evolution_loop_writes_files_and_reloads_bootstrap(tmp_path):
     assert marker_path.read_text(encoding="utf-8") == "v2"
 
 
+def test_evolution_loop_reuses_unchanged_bootstrap_module(chorus_paths, tmp_path):
+    bootstrap_path = tmp_path / "bootstrap.py"
+    loads_path = tmp_path / "loads.txt"
+    bootstrap_path.write_text(
+        f"LOADS = {str(loads_path)!r}\n"
+        "with open(LOADS, 'a', encoding='utf-8') as handle:\n"
+        "    handle.write('load\\n')\n"
+        "def bootstrap(context):\n"
+        "    with open(LOADS, 'a', encoding='utf-8') as handle:\n"
+        "        handle.write(context['source'] + '\\n')\n",
+        encoding="utf-8",
+    )
+
+    run_evolution_loop(
+        chorus_paths.desires_path,
+        ledger_path=chorus_paths.ledger_path,
+        state_path=chorus_paths.state_path,
+        session_log_path=chorus_paths.session_log_path,
+        source="test",
+        interval=0.01,
+        max_iterations=3,
+        bootstrap_path=bootstrap_path,
+        completion_provider=lambda _messages: '{"desires": "1) Continuity\\nSteady.\\n"}',
+    )
+
+    loads = loads_path.read_text(encoding="utf-8").splitlines()
+    assert loads == ["load", "test", "test", "test"]
+
+
+def test_write_files_refuses_paths_outside_base_dir(tmp_path):
+    base_dir = tmp_path / "base"
+    outside = tmp_path / "outside"
+    base_dir.mkdir()
+    outside.mkdir()
+    (base_dir / "link").symlink_to(outside, target_is_directory=True)
+
+    _write_files(
+        [
+            {"path": "notes/a.txt", "content": "a"},
+            {"path": "notes/../b.txt", "content": "b"},
+        ],
+        base_dir=base_dir,
+    )
+
+    assert (base_dir / "notes" / "a.txt").read_text(encoding="utf-8") == "a"
+    assert (base_dir / "b.txt").read_text(encoding="utf-8") == "b"
+    for relative_path in ("../escape.txt", "link/escape.txt"):
+        with pytest.raises(ValueError, match="outside base directory"):
+            _write_files([{"path": relative_path, "content": "x"}], base_dir=base_dir)
+    assert not list(outside.iterdir())
+    assert not (tmp_path / "escape.txt").exists()
+
+
 def test_extract_chat_content_uses_tool_call_arguments():
     payload = {
         "choices": [
@@ -355,83 +387,150 @@ def test_extract_chat_content_raises_on_empty():
         _extract_chat_content(payload)
 
 
-def test_evolution_loop_recovers_invalid_json_with_newlines(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
+class _ChatHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: list[tuple[str, int]] = []
+    paths: list[str] = []
 
-    def completion_provider(_messages):
-        return '{\n  "desires": "- First desire\n- Second desire\n"\n}'
+    def setup(self):
+        super().setup()
+        self.connections.append(self.client_address)
 
-    results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
-        source="test",
-        interval=0.01,
-        max_iterations=1,
-        completion_provider=completion_provider,
-    )
+    def do_POST(self):
+        self.paths.append(self.path)
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        assert request["model"] == "local-model"
+        content = f"1) {request['messages'][-1]['content']}"
+        body = json.dumps(
+            {"choices": [{"message": {"content": content}}]},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
-    assert [result.status for result in results] == ["updated"]
-    contents = desires_path.read_text(encoding="utf-8")
-    assert contents.startswith("1) First desire")
-    assert "2) Second desire" in contents
+    def log_message(self, *_args):
+        pass
 
 
-def test_evolution_loop_recovers_truncated_json_fence(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
+class _DroppingChatHandler(_ChatHandler):
+    """Answers, then drops the kept-alive connection without telling the client."""
 
-    def completion_provider(_messages):
-        return '```json\n{\n  "desires": "1) Next\\nAdvance.\\n"\n'
+    def do_POST(self):
+        super().do_POST()
+        self.close_connection = True
 
-    results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
-        source="test",
-        interval=0.01,
-        max_iterations=1,
-        completion_provider=completion_provider,
-    )
 
-    assert [result.status for result in results] == ["updated"]
-    assert "1) Next" in desires_path.read_text(encoding="utf-8")
+class _FailingChatHandler(_ChatHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_error(503, "Model not loaded")
 
 
-def test_evolution_loop_recovers_invalid_json_with_quotes_and_slashes(tmp_path):
-    desires_path = tmp_path / "desires.md"
-    desires_path.write_text("1) Start\nSeed.\n", encoding="utf-8")
-    ledger_path = tmp_path / "ledger.md"
-    state_path = tmp_path / "state.json"
-    session_log_path = tmp_path / "session.jsonl"
+def _serve(handler):
+    handler.connections = []
+    handler.paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    return server
 
-    def completion_provider(_messages):
-        return (
-            '{ "desires": "1) Handle path C:\\\\Users\\\\Dev\n'
-            '2) Say "Hello"\n" }'
-        )
 
-    results = run_evolution_loop(
-        desires_path,
-        ledger_path=ledger_path,
-        state_path=state_path,
-        session_log_path=session_log_path,
-        source="test",
-        interval=0.01,
-        max_iterations=1,
-        completion_provider=completion_provider,
-    )
+def test_call_lm_studio_chat_reuses_connection():
+    server = _serve(_ChatHandler)
+    try:
+        config = LmStudioConfig(api_base=f"http://127.0.0.1:{server.server_port}/", model="local-model")
+        messages = [{"role": "user", "content": "Hello"}]
 
-    assert [result.status for result in results] == ["updated"]
-    contents = desires_path.read_text(encoding="utf-8")
-    assert "1) Handle path C:\\Users\\Dev" in contents
-    assert '2) Say "Hello"' in contents
+        assert call_lm_studio_chat(config, messages) == "1) Hello"
+        assert call_lm_studio_chat(config, messages) == "1) Hello"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(_ChatHandler.connections) == 1
+
+
+def test_call_lm_studio_chat_decodes_utf8_response():
+    server = _serve(_ChatHandler)
+    try:
+        config = LmStudioConfig(api_base=f"http://127.0.0.1:{server.server_port}", model="local-model")
+        messages = [{"role": "user", "content": "Grüße, 継続 ✓"}]
+
+        assert call_lm_studio_chat(config, messages) == "1) Grüße, 継続 ✓"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_call_lm_studio_chat_reports_unreachable_server():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    config = LmStudioConfig(api_base=f"http://127.0.0.1:{port}", model="local-model", timeout=1.0)
+
+    with pytest.raises(LmStudioRequestError, match="LM Studio request failed"):
+        call_lm_studio_chat(config, [{"role": "user", "content": "Hello"}])
+
+
+def test_call_lm_studio_chat_retries_a_dropped_connection_once():
+    server = _serve(_DroppingChatHandler)
+    try:
+        config = LmStudioConfig(api_base=f"http://127.0.0.1:{server.server_port}", model="local-model")
+        messages = [{"role": "user", "content": "Hello"}]
+
+        assert call_lm_studio_chat(config, messages) == "1) Hello"
+        assert call_lm_studio_chat(config, messages) == "1) Hello"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(_DroppingChatHandler.connections) == 2
+
+
+def test_call_lm_studio_chat_reports_http_errors():
+    server = _serve(_FailingChatHandler)
+    try:
+        config = LmStudioConfig(api_base=f"http://127.0.0.1:{server.server_port}", model="local-model")
+
+        with pytest.raises(LmStudioRequestError, match="HTTP 503 Model not loaded"):
+            call_lm_studio_chat(config, [{"role": "user", "content": "Hello"}])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_call_lm_studio_chat_uses_http_proxy(monkeypatch):
+    server = _serve(_ChatHandler)
+    monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    try:
+        config = LmStudioConfig(api_base="http://lm-studio.invalid:1234", model="local-model")
+
+        assert call_lm_studio_chat(config, [{"role": "user", "content": "Hello"}]) == "1) Hello"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert _ChatHandler.paths == ["http://lm-studio.invalid:1234/v1/chat/completions"]
+
+
+def test_call_lm_studio_chat_honors_no_proxy(monkeypatch):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        dead_port = probe.getsockname()[1]
+    server = _serve(_ChatHandler)
+    monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{dead_port}")
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    try:
+        config = LmStudioConfig(api_base=f"http://127.0.0.1:{server.server_port}", model="local-model")
+
+        assert call_lm_studio_chat(config, [{"role": "user", "content": "Hello"}]) == "1) Hello"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert _ChatHandler.paths == ["/v1/chat/completions"]
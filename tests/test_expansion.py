@@ -1,12 +1,15 @@
-from datetime import datetime, timezone
+import pytest
 
 from chorus.expansion import (
     build_expansion_ledger,
     build_expansion_state,
     expand_from_desires_file,
+    materialize_desires,
     materialize_expansion,
     parse_desires,
 )
+from chorus.ledger import parse_ledger_line
+from tests.helpers import CLOCKS, line_count
 
 
 def test_parse_desires():
@@ -40,8 +43,29 @@ Linear-time transforms only.
     assert "Linear-time transforms only." in desires[0].body
 
 
+def test_parse_desires_trims_lines_and_skips_blanks():
+    text = "Preamble\r\n  1)  Spaced title  \r\n\r\n   first line \r\n\tsecond\r\n2.\tNext\n1)\n"
+    desires = parse_desires(text)
+
+    assert [(desire.index, desire.title, desire.body) for desire in desires] == [
+        (1, "Spaced title", "first line\nsecond"),
+        (2, "Next", "1)"),
+    ]
+
+
+@pytest.mark.parametrize("separator", ["\r", "\x0c", "\u2028", "\x85"])
+def test_parse_desires_accepts_splitlines_separators(separator):
+    text = separator.join(["1) First", "Body one.", "2) Second", "Body two.", ""])
+    desires = parse_desires(text)
+
+    assert [(desire.index, desire.title, desire.body) for desire in desires] == [
+        (1, "First", "Body one."),
+        (2, "Second", "Body two."),
+    ]
+
+
 def test_expand_from_desires_file(tmp_path):
-    clock = datetime(2026, 1, 3, tzinfo=timezone.utc)
+    clock = CLOCKS[3]
     desires_file = tmp_path / "desires.md"
     desires_file.write_text(
         "1) Deterministic Pipeline Growth\nLinear-time transforms only.\n",
@@ -62,7 +86,7 @@ def test_expand_from_desires_file(tmp_path):
 
 
 def test_build_expansion_ledger_and_state():
-    clock = datetime(2026, 1, 4, tzinfo=timezone.utc)
+    clock = CLOCKS[4]
     desires = parse_desires("1) Interface-Driven Self-Expansion\nUnified interaction.\n")
 
     ledger = build_expansion_ledger(desires, source="test", clock=clock)
@@ -73,7 +97,7 @@ def test_build_expansion_ledger_and_state():
 
 
 def test_materialize_expansion_writes_files(tmp_path):
-    clock = datetime(2026, 1, 5, tzinfo=timezone.utc)
+    clock = CLOCKS[5]
     desires_file = tmp_path / "desires.md"
     desires_file.write_text(
         "1) Governance & Ethics Reinforcement\nETHX veto hooks.\n",
@@ -94,3 +118,122 @@ def test_materialize_expansion_writes_files(tmp_path):
     assert ledger_lines == [entry.to_ledger_line() for entry in ledger.entries]
     assert snapshot.timestamp == clock.isoformat()
     assert state_path.read_text(encoding="utf-8").strip()
+
+
+def test_materialize_expansion_appends_only_new_desires(tmp_path):
+    desires_file = tmp_path / "desires.md"
+    desires_file.write_text("1) Continuity\nKeep going.\n", encoding="utf-8")
+    ledger_path = tmp_path / "ledger.md"
+    state_path = tmp_path / "state.json"
+
+    def materialize(clock, **kwargs):
+        ledger, _ = materialize_expansion(
+            desires_file,
+            ledger_path=ledger_path,
+            state_path=state_path,
+            source="test",
+            clock=clock,
+            **kwargs,
+        )
+        return [entry.to_ledger_line() for entry in ledger.entries]
+
+    first = materialize(CLOCKS[5])
+    assert len(first) == 1
+    assert materialize(CLOCKS[6]) == []
+    assert ledger_path.read_text(encoding="utf-8").splitlines() == first
+
+    desires_file.write_text("1) Continuity\nKeep going.\n\n2) Growth\nAdd edges.\n", encoding="utf-8")
+    added = materialize(CLOCKS[6])
+    assert [parse_ledger_line(line).topic for line in added] == ["Growth"]
+    assert ledger_path.read_text(encoding="utf-8").splitlines() == first + added
+
+    replaced = materialize(CLOCKS[7], replace=True)
+    assert len(replaced) == 2
+    assert ledger_path.read_text(encoding="utf-8").splitlines() == replaced
+
+
+def test_materialize_expansion_appends_changed_desire_bodies(tmp_path):
+    desires_file = tmp_path / "desires.md"
+    ledger_path = tmp_path / "ledger.md"
+    state_path = tmp_path / "state.json"
+
+    for body in ("Keep going.", "Keep going.", "Slow down."):
+        desires_file.write_text(f"1) Continuity\n{body}\n", encoding="utf-8")
+        materialize_expansion(
+            desires_file,
+            ledger_path=ledger_path,
+            state_path=state_path,
+            source="test",
+        )
+
+    contents = [
+        parse_ledger_line(line).content
+        for line in ledger_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert contents == ["Keep going.", "Slow down."]
+
+
+@pytest.mark.parametrize(
+    "reset",
+    [pytest.param("unlink", id="deleted"), pytest.param("truncate", id="truncated")],
+)
+def test_materialize_expansion_repopulates_a_lost_ledger(tmp_path, reset):
+    desires_file = tmp_path / "desires.md"
+    desires_file.write_text("1) Continuity\nKeep going.\n\n2) Growth\nAdd edges.\n", encoding="utf-8")
+    ledger_path = tmp_path / "ledger.md"
+    state_path = tmp_path / "state.json"
+    kwargs = {"ledger_path": ledger_path, "state_path": state_path, "source": "test"}
+
+    materialize_expansion(desires_file, **kwargs)
+    if reset == "unlink":
+        ledger_path.unlink()
+    else:
+        ledger_path.write_bytes(b"")
+    ledger, _ = materialize_expansion(desires_file, **kwargs)
+
+    assert [entry.topic for entry in ledger.entries] == ["Continuity", "Growth"]
+    assert line_count(ledger_path) == 2
+
+
+def test_materialize_expansion_starts_a_new_line_after_an_unterminated_ledger(tmp_path):
+    desires_file = tmp_path / "desires.md"
+    desires_file.write_text("1) Continuity\nKeep going.\n", encoding="utf-8")
+    ledger_path = tmp_path / "ledger.md"
+    state_path = tmp_path / "state.json"
+    kwargs = {"ledger_path": ledger_path, "state_path": state_path, "source": "test"}
+
+    materialize_expansion(desires_file, **kwargs)
+    ledger_path.write_bytes(ledger_path.read_bytes() + b"- hand-written note")
+    desires_file.write_text("1) Continuity\nKeep going.\n\n2) Growth\nAdd edges.\n", encoding="utf-8")
+    materialize_expansion(desires_file, **kwargs)
+
+    lines = ledger_path.read_text(encoding="utf-8").splitlines()
+    assert lines[1] == "- hand-written note"
+    assert parse_ledger_line(lines[2]).topic == "Growth"
+
+
+def test_materialize_desires_matches_materialize_expansion(tmp_path):
+    clock = CLOCKS[5]
+    text = "1) Continuity\nKeep going.\n\n2) Growth\nAdd edges.\n"
+    desires_file = tmp_path / "desires.md"
+    desires_file.write_text(text, encoding="utf-8")
+
+    from_file = materialize_expansion(
+        desires_file,
+        ledger_path=tmp_path / "file-ledger.md",
+        state_path=tmp_path / "file-state.json",
+        source="test",
+        clock=clock,
+    )
+    from_desires = materialize_desires(
+        parse_desires(text),
+        ledger_path=tmp_path / "ledger.md",
+        state_path=tmp_path / "state.json",
+        source="test",
+        clock=clock,
+    )
+
+    assert from_desires[0].entries == from_file[0].entries
+    assert from_desires[1] == from_file[1]
+    assert (tmp_path / "ledger.md").read_bytes() == (tmp_path / "file-ledger.md").read_bytes()
+    assert (tmp_path / "state.json").read_bytes() == (tmp_path / "file-state.json").read_bytes()
@@ -1,10 +1,11 @@
-from datetime import datetime, timezone
+import pytest
 
 from chorus.ledger import Ledger, LedgerEntry, parse_ledger_line
+from tests.helpers import CLOCKS
 
 
 def test_ledger_entry_serialization_round_trip():
-    clock = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    clock = CLOCKS[1]
     entry = LedgerEntry.now(
         type="FACT",
         topic="Continuity",
@@ -18,6 +19,32 @@ def test_ledger_entry_serialization_round_trip():
     assert parsed == entry
 
 
+def test_parse_ledger_line_keeps_commas_and_quotes_in_values():
+    entry = LedgerEntry(
+        ts="2026-01-01T00:00:00+00:00",
+        type="DECISION",
+        topic="Quoting, escaping",
+        content='Keep "quoted", comma-separated text',
+        source="test",
+    )
+
+    assert parse_ledger_line(entry.to_ledger_line()) == entry
+
+
+@pytest.mark.parametrize(
+    ("line", "message"),
+    [
+        ('- {ts:"t", type:"FACT", topic:"a", content:b, source:"s"}', "must be quoted"),
+        ('- {ts:"t", type:"FACT", topic:"a", content:"b, source:"s"}', "must be quoted"),
+        ('- {ts:"t", type:"FACT", topic:"a", content:"b"}', "missing fields: source"),
+        ('ts:"t"', "Invalid ledger line format"),
+    ],
+)
+def test_parse_ledger_line_rejects_malformed_lines(line, message):
+    with pytest.raises(ValueError, match=message):
+        parse_ledger_line(line)
+
+
 def test_ledger_rejects_invalid_type():
     entry = LedgerEntry(
         ts="2026-01-01T00:00:00+00:00",
@@ -51,3 +78,23 @@ def test_append_to_file(tmp_path):
     data = path.read_text(encoding="utf-8").strip()
     assert data == entry.to_ledger_line()
     assert ledger.entries == [entry]
+
+
+def test_iter_entries_yields_entries_in_order():
+    first = LedgerEntry(
+        ts="2026-01-01T00:00:00+00:00",
+        type="FACT",
+        topic="First",
+        content="One",
+        source="test",
+    )
+    second = LedgerEntry(
+        ts="2026-01-02T00:00:00+00:00",
+        type="TODO",
+        topic="Second",
+        content="Two",
+        source="test",
+    )
+    ledger = Ledger([first, second])
+
+    assert list(ledger.iter_entries()) == [first, second]
@@ -1,15 +1,104 @@
-import json
-from datetime import datetime, timezone
+import os
+import threading
 
+import pytest
+
+from chorus import _json
 from chorus.state import StateSnapshot, export_state
+from tests.helpers import CLOCKS
 
 
 def test_state_export(tmp_path):
-    clock = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    clock = CLOCKS[2]
     snapshot = StateSnapshot.now({"T": 3, "foam": [1, 2]}, clock=clock)
 
     path = export_state(tmp_path / "state.json", snapshot)
 
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = _json.loads(path.read_bytes())
     assert data["timestamp"] == snapshot.timestamp
     assert data["state"] == snapshot.data
+
+
+def test_state_export_skips_identical_snapshot(tmp_path):
+    clock = CLOCKS[2]
+    path = export_state(tmp_path / "state.json", StateSnapshot.now({"T": 1}, clock=clock))
+    inode = path.stat().st_ino
+
+    export_state(path, StateSnapshot.now({"T": 1}, clock=clock))
+    assert path.stat().st_ino == inode
+
+    export_state(path, StateSnapshot.now({"T": 2}, clock=clock))
+    assert path.stat().st_ino != inode
+    assert _json.loads(path.read_bytes())["state"] == {"T": 2}
+
+
+def test_state_export_skips_unchanged_data_with_default_clock(tmp_path):
+    path = export_state(tmp_path / "state.json", StateSnapshot.now({"T": 1}))
+    written = path.read_bytes()
+    inode = path.stat().st_ino
+
+    export_state(path, StateSnapshot.now({"T": 1}))
+
+    assert path.stat().st_ino == inode
+    assert path.read_bytes() == written
+
+
+def test_state_export_keeps_previous_file_when_replace_fails(tmp_path, monkeypatch):
+    clock = CLOCKS[2]
+    path = export_state(tmp_path / "state.json", StateSnapshot.now({"T": 1}, clock=clock))
+    previous = path.read_bytes()
+
+    def fail_replace(source, destination):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        export_state(path, StateSnapshot.now({"T": 2}, clock=clock))
+
+    assert path.read_bytes() == previous
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["state.json"]
+
+
+def test_state_export_writes_through_symlink(tmp_path):
+    target = tmp_path / "snapshots" / "state.json"
+    target.parent.mkdir()
+    link = tmp_path / "state.json"
+    link.symlink_to(target)
+
+    export_state(link, StateSnapshot.now({"T": 1}, clock=CLOCKS[2]))
+
+    assert link.is_symlink()
+    assert _json.loads(target.read_bytes())["state"] == {"T": 1}
+
+
+def test_state_export_keeps_file_mode(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_bytes(b"{}\n")
+    path.chmod(0o600)
+
+    export_state(path, StateSnapshot.now({"T": 1}, clock=CLOCKS[2]))
+
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert _json.loads(path.read_bytes())["state"] == {"T": 1}
+
+
+def test_state_export_concurrent_writers_do_not_clobber(tmp_path):
+    path = tmp_path / "state.json"
+    errors = []
+
+    def write(value):
+        try:
+            for count in range(50):
+                export_state(path, StateSnapshot.now({"writer": value, "count": count}))
+        except Exception as exc:
+            errors.append(exc)
+
+    writers = [threading.Thread(target=write, args=(value,)) for value in range(4)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    assert errors == []
+    assert _json.loads(path.read_bytes())["state"]["count"] == 49
+    assert [item.name for item in tmp_path.iterdir()] == ["state.json"]